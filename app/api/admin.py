@@ -1,26 +1,56 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from ..db.session import get_db
+from ..db.session import get_db, run_in_session
 from ..schemas.schemas import (
     EventCreate, EventUpdate, EventResponse, 
     AnalyticsSummary, PopularEvent, DailyTrend,
-    VenueHeatmapResponse, PricingAnalytics
+    VenueHeatmapResponse, PricingAnalytics, EventListAdapter, from_orm_fast
 )
-from ..crud.event import get_event_by_id, update_event, delete_event, get_events, get_popular_events_stats, get_daily_booking_trends
+from ..crud.event import update_event, delete_event, get_events, count_events, get_popular_events_stats, stream_daily_booking_trends
 from ..crud.booking import get_booking_analytics, get_pricing_analytics
-from ..crud.user import get_users
+from ..crud.user import count_users
 from ..services.booking import EventService
-from ..services.cache import CacheService
+from ..services.cache import invalidate_events_list_cache
 from ..services.venue_heatmap import VenueHeatmapService
-from ..core.deps import get_current_admin_user
-from ..models.models import User
-from ..schemas.schemas import EventCreate, EventResponse
+from ..core.deps import get_current_admin_user, get_event_cached
+from ..models.models import User, Event
 
 router = APIRouter()
 
 
+async def _stream_json_array(rows):
+    """
+    Return a body iterator that encodes rows from an async iterator as an orjson
+    JSON array, one element at a time. The first row is fetched before returning,
+    so query/connection errors raise here, before the 200 status is sent, instead
+    of truncating a streamed body.
+    """
+    try:
+        first = await rows.__anext__()
+    except StopAsyncIteration:
+        first = None
+        rows = None
+
+    async def body():
+        if rows is None:
+            yield b"[]"
+            return
+        try:
+            yield b"[" + orjson.dumps(first)
+            async for row in rows:
+                yield b"," + orjson.dumps(row)
+            yield b"]"
+        finally:
+            await rows.aclose()
+
+    return body()
+
+
 @router.post("/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_new_event(
     event_data: EventCreate,
@@ -51,9 +81,8 @@ async def create_new_event(
             base_price=event_data.base_price,
             created_by=current_admin.id
         )
-        # Invalidate cached event lists
-        CacheService.delete_pattern("events:list:*")
-        return EventResponse.model_validate(event)
+        # Cached event lists are invalidated by EventService
+        return from_orm_fast(EventResponse, event)
     except HTTPException:
         raise
     except Exception as e:
@@ -68,11 +97,11 @@ async def update_existing_event(
     event_id: UUID,
     event_data: EventUpdate,
     db: AsyncSession = Depends(get_db),
+    existing_event: Optional[Event] = Depends(get_event_cached),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Update an existing event"""
     # Check if event exists
-    existing_event = await get_event_by_id(db, event_id)
     if not existing_event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -84,19 +113,18 @@ async def update_existing_event(
     updated_event = await update_event(db, event_id, update_data)
     
     # Clear related caches
-    CacheService.delete_pattern("events:list:*")
-    CacheService.delete(f"event:{event_id}")
+    await invalidate_events_list_cache(f"event:{event_id}")
     
-    return EventResponse.model_validate(updated_event)
+    return from_orm_fast(EventResponse, updated_event)
 
 
 @router.delete("/events/{event_id}")
 async def delete_existing_event(
     event_id: UUID,
     db: AsyncSession = Depends(get_db),
+    existing_event: Optional[Event] = Depends(get_event_cached),
     current_admin: User = Depends(get_current_admin_user)
 ):
-    existing_event = await get_event_by_id(db, event_id)
     if not existing_event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     try:
@@ -105,9 +133,7 @@ async def delete_existing_event(
         raise HTTPException(status_code=500, detail=str(e))
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete event")
-    CacheService.delete_pattern("events:list:*")
-    CacheService.delete(f"event:{event_id}")
-    CacheService.delete(f"event:{event_id}:seats")
+    await invalidate_events_list_cache(f"event:{event_id}", f"event:{event_id}:seats")
     return {"message": "Event deleted successfully"}
 
 
@@ -124,26 +150,26 @@ async def list_all_events(
         db, skip=skip, limit=limit, upcoming_only=not include_past
     )
     
-    return [EventResponse.model_validate(event) for event in events]
+    return Response(
+        content=EventListAdapter.dump_json(
+            EventListAdapter.validate_python(events, from_attributes=True)
+        ),
+        media_type="application/json"
+    )
 
 
 @router.get("/analytics/summary", response_model=AnalyticsSummary)
 async def get_analytics_summary(
-    db: AsyncSession = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get overall analytics summary"""
     try:
-        # Get booking analytics
-        booking_data = await get_booking_analytics(db)
-        
-        # Get total events count
-        all_events = await get_events(db, skip=0, limit=10000, upcoming_only=False)
-        total_events = len(all_events)
-        
-        # Get total users count  
-        all_users = await get_users(db, skip=0, limit=10000)
-        total_users = len(all_users)
+        # Independent queries, each on its own session, run concurrently
+        total_events, total_users, booking_data = await asyncio.gather(
+            run_in_session(count_events),
+            run_in_session(count_users),
+            run_in_session(get_booking_analytics)
+        )
         
         return AnalyticsSummary(
             total_events=total_events,
@@ -167,21 +193,28 @@ async def get_popular_events(
 ):
     """Get most popular events by confirmed booking count"""
     rows = await get_popular_events_stats(db, limit=limit)
-    return [
-        PopularEvent(event_id=r.event_id, event_name=r.event_name, booking_count=r.booking_count)
-        for r in rows
-    ]
+    # Rows already have the response shape; encode them without building models
+    # (event_id is asyncpg's UUID subclass, which orjson rejects, so stringify it)
+    return Response(
+        content=orjson.dumps([
+            {"event_id": str(r.event_id), "event_name": r.event_name, "booking_count": r.booking_count}
+            for r in rows
+        ]),
+        media_type="application/json"
+    )
 
 
 @router.get("/analytics/trends/daily", response_model=List[DailyTrend])
 async def get_daily_trends(
     days: int = Query(30, ge=1, le=365),
-    db: AsyncSession = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get real daily booking trends (confirmed bookings and revenue)"""
-    data = await get_daily_booking_trends(db, days=days)
-    return [DailyTrend(**row) for row in data]
+    # Rows are streamed straight from the database cursor into the response body
+    return StreamingResponse(
+        await _stream_json_array(stream_daily_booking_trends(days=days)),
+        media_type="application/json"
+    )
 
 
 # Venue Heatmap endpoints
@@ -206,7 +239,8 @@ async def get_venue_heatmap(
                 detail="Event not found"
             )
         
-        return heatmap_response
+        # Large per-seat payload: serialize the already-built model once
+        return Response(content=heatmap_response.model_dump_json(), media_type="application/json")
         
     except HTTPException:
         raise
@@ -221,13 +255,13 @@ async def get_venue_heatmap(
 async def refresh_venue_heatmap(
     event_id: UUID,
     db: AsyncSession = Depends(get_db),
+    event: Optional[Event] = Depends(get_event_cached),
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Force refresh venue heatmap analytics (admin only)"""
     
     try:
         # Check if event exists
-        event = await get_event_by_id(db, event_id)
         if not event:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
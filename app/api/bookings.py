@@ -1,20 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from uuid import UUID
 from ..db.session import get_db
 from ..schemas.schemas import (
     BookingCreate, BookingCreateWithPricing, BookingResponse, TicketResponse,
-    EventPricingResponse, BookingCostEstimate
+    EventPricingResponse, BookingCostEstimate, BookingListAdapter,
+    BookingStatus, from_orm_fast
 )
 from ..crud.booking import get_user_bookings, get_booking_by_id
 from ..services.booking import BookingService
 from ..services.pricing import DynamicPricingService
-from ..core.deps import get_current_user
-from ..models.models import User
+from ..core.deps import get_current_user, load_event
+from ..models.models import User, Booking
 
 router = APIRouter()
 
+
+def _booking_response(booking: Booking) -> BookingResponse:
+    """Build a BookingResponse from a loaded ORM booking without validation"""
+    return from_orm_fast(
+        BookingResponse,
+        booking,
+        status=BookingStatus(booking.status.value),
+        tickets=[from_orm_fast(TicketResponse, ticket) for ticket in booking.tickets]
+    )
+
+
+def _booking_json_response(booking: Booking, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize a booking straight to JSON; returning a Response skips FastAPI's
+    response_model re-validation and jsonable pass for a model we built ourselves.
+    """
+    return Response(
+        content=_booking_response(booking).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 @router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
 async def create_booking(
     booking_data: BookingCreateWithPricing,
@@ -22,33 +46,17 @@ async def create_booking(
     current_user: User = Depends(get_current_user)
 ):
     try:
-        # BookingService now handles its own transaction with dynamic pricing
+        # BookingService now handles its own transaction with dynamic pricing;
+        # only the requested seats' rows are locked, so bookings for the same
+        # event run concurrently
         booking = await BookingService.create_booking(
             db, current_user.id, booking_data.event_id, 
             booking_data.seat_identifiers,
             booking_data.acknowledged_price_per_ticket
         )
         
-        # Build response - booking is now committed and relationships are loaded
-        response = BookingResponse(
-            id=booking.id,
-            event_id=booking.event_id,
-            status=booking.status,
-            base_price_per_ticket=booking.base_price_per_ticket,
-            final_price_per_ticket=booking.final_price_per_ticket,
-            price_multiplier=booking.price_multiplier,
-            total_amount=booking.total_amount,
-            created_at=booking.created_at,
-            tickets=[
-                TicketResponse(
-                    id=t.id,
-                    seat_id=t.seat_id,
-                    qr_code_data=t.qr_code_data
-                )
-                for t in booking.tickets
-            ]
-        )
-        return response
+        # Booking is committed and its tickets are loaded
+        return _booking_json_response(booking, status_code=status.HTTP_201_CREATED)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -65,7 +73,10 @@ async def get_my_bookings(
     current_user: User = Depends(get_current_user)
 ):
     bookings = await get_user_bookings(db, current_user.id, skip=skip, limit=limit)
-    return [BookingResponse.model_validate(b) for b in bookings]
+    return Response(
+        content=BookingListAdapter.dump_json([_booking_response(b) for b in bookings]),
+        media_type="application/json"
+    )
 
 @router.delete("/{booking_id}", response_model=BookingResponse, status_code=200)
 async def cancel_booking(
@@ -79,7 +90,7 @@ async def cancel_booking(
     booking = await BookingService.cancel_booking(db, booking_id, current_user.id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
-    return BookingResponse.model_validate(booking)
+    return _booking_json_response(booking)
 
 @router.get("/{booking_id}", response_model=BookingResponse)
 async def get_booking(
@@ -90,7 +101,7 @@ async def get_booking(
     booking = await get_booking_by_id(db, booking_id)
     if not booking or booking.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Booking not found")
-    return BookingResponse.model_validate(booking)
+    return _booking_json_response(booking)
 
 
 @router.get("/pricing/event/{event_id}", response_model=EventPricingResponse)
@@ -108,14 +119,14 @@ async def get_event_pricing(
 
 @router.post("/pricing/estimate", response_model=BookingCostEstimate)
 async def estimate_booking_cost(
+    request: Request,
     booking_data: BookingCreate,
     db: AsyncSession = Depends(get_db)
 ):
     """Estimate the cost of a booking without creating it"""
     try:
         # Get event details
-        from ..crud.event import get_event_by_id
-        event = await get_event_by_id(db, booking_data.event_id)
+        event = await load_event(request, db, booking_data.event_id)
         if not event:
             raise ValueError("Event not found")
         
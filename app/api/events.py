@@ -1,21 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime, timezone
+import asyncio
+import hashlib
+import orjson
 from ..db.session import get_db
-from ..schemas.schemas import EventResponse, EventWithPricingResponse, SeatMapResponse, SeatResponse
-from ..crud.event import get_events, get_event_by_id, get_event_seats
+from ..schemas.schemas import (
+    EventResponse, EventWithPricingResponse, SeatMapResponse,
+    EventListAdapter, from_orm_fast
+)
+from ..crud.event import get_events, get_event_seat_rows
 from ..services.cache import CacheService, get_events_cache_key, get_event_cache_key, get_event_seats_cache_key
 from ..services.pricing import DynamicPricingService
-from ..core.deps import get_current_user_optional
-from ..models.models import User
+from ..core.deps import get_current_user_optional, load_event, get_event_cached
+from ..models.models import User, Event
 
 router = APIRouter()
 
+# Upper bound on how long a page of upcoming events is served from cache (seconds)
+EVENTS_LIST_CACHE_TTL = 1800
+
+# Seat maps are invalidated on every booking/cancellation, so the TTL is only a backstop
+SEAT_MAP_CACHE_TTL = 300
+# Only one request rebuilds a missing seat map; others poll the cache briefly
+SEAT_MAP_REBUILD_LOCK_TTL = 5
+SEAT_MAP_REBUILD_POLL_INTERVAL = 0.05
+SEAT_MAP_REBUILD_POLLS = 10
+
+
+def _etag_json_response(request: Request, payload) -> Response:
+    """Return a JSON payload with an ETag, or 304 if the client's copy is current"""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=payload, media_type="application/json", headers=headers)
+
 
 @router.get("/", response_model=List[EventResponse])
 async def list_events(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
@@ -23,27 +54,35 @@ async def list_events(
 ):
     """Get list of upcoming events (public endpoint with caching)"""
     
-    # Try to get from cache first
-    cache_key = get_events_cache_key(skip, limit)
-    cached_events = CacheService.get(cache_key)
+    # Try to get from cache first (stored as serialized JSON, returned as-is)
+    cache_key = await get_events_cache_key(skip, limit)
+    cached_events = await CacheService.get_raw(cache_key)
     
     if cached_events:
-        return cached_events
+        return _etag_json_response(request, cached_events)
     
     # Get from database
     events = await get_events(db, skip=skip, limit=limit, upcoming_only=True)
     
-    # Convert to response format
-    events_response = [EventResponse.model_validate(event) for event in events]
+    # Serialize once; the same bytes are cached and returned
+    payload = EventListAdapter.dump_json(
+        EventListAdapter.validate_python(events, from_attributes=True)
+    )
     
-    # Cache for 30 minutes
-    CacheService.set(cache_key, [event.model_dump() for event in events_response], expire=1800)
+    # Cache for 30 minutes, but never past the first listed event's start time:
+    # after that the page is no longer an "upcoming" list
+    expire = EVENTS_LIST_CACHE_TTL
+    if events:
+        seconds_to_first_start = (events[0].start_time - datetime.now(timezone.utc)).total_seconds()
+        expire = max(1, min(expire, int(seconds_to_first_start)))
+    await CacheService.set_raw(cache_key, payload, expire=expire)
     
-    return events_response
+    return _etag_json_response(request, payload)
 
 
 @router.get("/{event_id}", response_model=EventResponse)
 async def get_event(
+    request: Request,
     event_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -52,29 +91,30 @@ async def get_event(
     
     # Try cache first
     cache_key = get_event_cache_key(event_id)
-    cached_event = CacheService.get(cache_key)
+    cached_event = await CacheService.get_raw(cache_key)
     
     if cached_event:
-        return EventResponse(**cached_event)
+        return _etag_json_response(request, cached_event)
     
     # Get from database
-    event = await get_event_by_id(db, event_id)
+    event = await load_event(request, db, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
     
-    event_response = EventResponse.model_validate(event)
+    payload = orjson.dumps(from_orm_fast(EventResponse, event).model_dump(mode="json"))
     
     # Cache for 1 hour
-    CacheService.set(cache_key, event_response.model_dump(), expire=3600)
+    await CacheService.set_raw(cache_key, payload, expire=3600)
     
-    return event_response
+    return _etag_json_response(request, payload)
 
 
 @router.get("/{event_id}/seats", response_model=SeatMapResponse)
 async def get_event_seat_map(
+    request: Request,
     event_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -84,48 +124,65 @@ async def get_event_seat_map(
     This is essential for frontend to render visual seat selection.
     """
     
-    # Check if event exists
-    event = await get_event_by_id(db, event_id)
-    if not event:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event not found"
-        )
-    
-    # Try cache first (shorter cache time due to frequent updates)
+    # Fetch the seat map and event entries in one round-trip
+    # (shorter cache time for seats due to frequent updates)
     cache_key = get_event_seats_cache_key(event_id)
-    cached_seats = CacheService.get(cache_key)
-    
-    if cached_seats:
-        return SeatMapResponse(
-            event_id=event_id,
-            seats=[SeatResponse(**seat) for seat in cached_seats]
-        )
-    
-    # Get from database
-    seats = await get_event_seats(db, event_id)
-    seats_response = [SeatResponse.model_validate(seat) for seat in seats]
-    
-    # Cache for 5 minutes (seats change frequently during booking)
-    CacheService.set(
-        cache_key, 
-        [seat.model_dump() for seat in seats_response], 
-        expire=300
-    )
-    
-    return SeatMapResponse(event_id=event_id, seats=seats_response)
+    cached_event, cached_seat_map = await CacheService.mget_raw(get_event_cache_key(event_id), cache_key)
+    
+    if cached_seat_map:
+        return Response(content=cached_seat_map, media_type="application/json")
+    
+    # Check if event exists (a cached event entry proves it)
+    if not cached_event:
+        event = await load_event(request, db, event_id)
+        if not event:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+    
+    # Stampede protection: concurrent misses wait for a single rebuild
+    lock_key = f"{cache_key}:lock"
+    lock_token = await CacheService.acquire_lock(lock_key, SEAT_MAP_REBUILD_LOCK_TTL)
+    if lock_token is None:
+        for _ in range(SEAT_MAP_REBUILD_POLLS):
+            await asyncio.sleep(SEAT_MAP_REBUILD_POLL_INTERVAL)
+            cached_seat_map = await CacheService.get_raw(cache_key)
+            if cached_seat_map:
+                return Response(content=cached_seat_map, media_type="application/json")
+    
+    try:
+        # Get plain column rows and serialize them straight to SeatMapResponse-shaped
+        # JSON; no per-seat model instances are built. asyncpg returns its own UUID
+        # subclass, which orjson rejects, so ids are stringified here
+        seat_rows = await get_event_seat_rows(db, event_id)
+        payload = orjson.dumps({
+            "event_id": str(event_id),
+            "seats": [
+                {"id": str(seat_id), "seat_identifier": seat_identifier, "status": seat_status.value}
+                for seat_id, seat_identifier, seat_status in seat_rows
+            ]
+        })
+        
+        await CacheService.set_raw(cache_key, payload, expire=SEAT_MAP_CACHE_TTL)
+    finally:
+        # Compare-and-delete: a rebuild that outlived the lock TTL must not
+        # release a lock another request has taken since
+        if lock_token is not None:
+            await CacheService.release_lock(lock_key, lock_token)
+    
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{event_id}/pricing", response_model=EventWithPricingResponse)
 async def get_event_with_pricing(
     event_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    event: Optional[Event] = Depends(get_event_cached),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Get event details with current pricing information"""
     
     # Get event details
-    event = await get_event_by_id(db, event_id)
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -141,18 +198,22 @@ async def get_event_with_pricing(
     days_until_event = max(0, (event.start_time - now).days)
     price_multiplier = DynamicPricingService.calculate_pricing_multiplier(days_until_event)
     
-    # Build response with pricing information
-    return EventWithPricingResponse(
-        id=event.id,
-        name=event.name,
-        venue=event.venue,
-        description=event.description,
-        start_time=event.start_time,
-        end_time=event.end_time,
-        total_capacity=event.total_capacity,
-        base_price=event.base_price,
-        current_price=current_price,
-        price_multiplier=price_multiplier,
-        days_until_event=days_until_event,
-        created_at=event.created_at
+    # Build response with pricing information; every field is server-computed,
+    # so serialize directly instead of validating and re-serializing
+    return Response(
+        content=EventWithPricingResponse.model_construct(
+            id=event.id,
+            name=event.name,
+            venue=event.venue,
+            description=event.description,
+            start_time=event.start_time,
+            end_time=event.end_time,
+            total_capacity=event.total_capacity,
+            base_price=event.base_price,
+            current_price=current_price,
+            price_multiplier=price_multiplier,
+            days_until_event=days_until_event,
+            created_at=event.created_at
+        ).model_dump_json(),
+        media_type="application/json"
     )
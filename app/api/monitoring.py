@@ -1,3 +1,4 @@
+import asyncio
 from fastapi import APIRouter, Depends
 from ..core.deps import get_current_admin_user
 from ..core.monitoring import (
@@ -44,8 +45,10 @@ async def get_database_metrics(
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get database metrics (admin only)"""
-    db_stats = await DatabaseMonitor.get_database_stats()
-    table_sizes = await DatabaseMonitor.get_table_sizes()
+    db_stats, table_sizes = await asyncio.gather(
+        DatabaseMonitor.get_database_stats(),
+        DatabaseMonitor.get_table_sizes()
+    )
     
     return {
         "connection_stats": db_stats,
@@ -58,7 +61,7 @@ async def get_cache_metrics(
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get cache metrics (admin only)"""
-    return CacheMonitor.get_cache_stats()
+    return await CacheMonitor.get_cache_stats()
 
 
 @router.get("/metrics/summary")
@@ -66,12 +69,17 @@ async def get_metrics_summary(
     current_admin: User = Depends(get_current_admin_user)
 ):
     """Get summary of all metrics (admin only)"""
+    database_stats, cache_stats, health = await asyncio.gather(
+        DatabaseMonitor.get_database_stats(),
+        CacheMonitor.get_cache_stats(),
+        HealthChecker.get_comprehensive_health()
+    )
     return {
         "performance": {
             "avg_response_time_5min": performance_monitor.get_average_response_time(5),
             "system": performance_monitor.get_system_metrics()
         },
-        "database": await DatabaseMonitor.get_database_stats(),
-        "cache": CacheMonitor.get_cache_stats(),
-        "health": await HealthChecker.get_comprehensive_health()
+        "database": database_stats,
+        "cache": cache_stats,
+        "health": health
     }
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from ..db.session import get_db
-from ..schemas.schemas import WaitlistJoin, WaitlistResponse
+from ..schemas.schemas import WaitlistJoin, WaitlistResponse, WaitlistListAdapter, from_orm_fast
 from ..crud.waitlist import join_waitlist, get_user_waitlist_entries
 from ..core.deps import get_current_user
 from ..models.models import User
@@ -24,7 +24,7 @@ async def join_event_waitlist(
             event_id=waitlist_data.event_id
         )
         
-        return WaitlistResponse.model_validate(waitlist_entry)
+        return from_orm_fast(WaitlistResponse, waitlist_entry)
         
     except ValueError as e:
         raise HTTPException(
@@ -50,4 +50,7 @@ async def get_my_waitlist_entries(
         db, user_id=current_user.id, skip=skip, limit=limit
     )
     
-    return [WaitlistResponse.model_validate(entry) for entry in entries]
+    return Response(
+        content=WaitlistListAdapter.dump_json([from_orm_fast(WaitlistResponse, entry) for entry in entries]),
+        media_type="application/json"
+    )
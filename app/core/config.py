@@ -1,20 +1,34 @@
+from dataclasses import make_dataclass
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     # Database
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_timeout: int = 10  # seconds to wait for a pooled connection
+    db_statement_cache_size: int = 1024
     
     # Redis
     redis_url: str
+    redis_max_connections: int = 50
     
     # Security
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # Reuse successful password checks for a few seconds (skips repeated bcrypt on hot logins)
+    password_verify_cache_enabled: bool = False
+    password_verify_cache_ttl: int = 10  # seconds
+    # Reuse decoded JWT payloads (skips HMAC verify per request); 0 disables
+    token_verify_cache_ttl: int = 60  # seconds, never past the token's exp
     
     # Environment
     environment: str = "development"
+    # Browser origins allowed by CORS (JSON list in env)
+    cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8000"]
     
     # Celery
     celery_broker_url: str
@@ -34,4 +48,13 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()
+# Env parsing happens once via Settings; request-time reads go through a frozen,
+# slotted dataclass built from the same fields so they are plain slot loads.
+FrozenSettings = make_dataclass(
+    "FrozenSettings",
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True,
+)
+
+settings = FrozenSettings(**Settings().model_dump())
@@ -1,20 +1,39 @@
-from fastapi import Depends, HTTPException, status
+import asyncio
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+from uuid import UUID
 from ..db.session import get_db
-from ..core.security import verify_token
-from ..crud.user import get_user_by_email
-from ..models.models import User, UserRole
+from ..core.security import verify_token_cached
+from ..crud.user import get_user_by_email, get_user_by_id
+from ..crud.event import get_event_by_id
+from ..models.models import User, UserRole, Event
 
 security = HTTPBearer()
 
 
+async def _get_user_from_payload(db: AsyncSession, payload: dict) -> Optional[User]:
+    """Resolve the token's user by primary key, falling back to email for older tokens"""
+    user_id = payload.get("uid")
+    if user_id is not None:
+        return await get_user_by_id(db, UUID(user_id))
+    
+    email: str = payload.get("sub")
+    if email is None:
+        return None
+    return await get_user_by_email(db, email=email)
+
+
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> User:
-    """Get current authenticated user"""
+    """Get current authenticated user (resolved once per request)"""
+    if (user := getattr(request.state, "user", None)) is not None:
+        return user
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -22,19 +41,19 @@ async def get_current_user(
     )
     
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     
     if payload is None:
         raise credentials_exception
     
-    email: str = payload.get("sub")
-    if email is None:
+    try:
+        user = await _get_user_from_payload(db, payload)
+    except ValueError:
         raise credentials_exception
-    
-    user = await get_user_by_email(db, email=email)
     if user is None:
         raise credentials_exception
     
+    request.state.user = user
     return user
 
 
@@ -52,6 +71,7 @@ async def get_current_admin_user(
 
 # Optional authentication for public endpoints
 async def get_current_user_optional(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
@@ -59,18 +79,41 @@ async def get_current_user_optional(
     if not credentials:
         return None
     
+    if (user := getattr(request.state, "user", None)) is not None:
+        return user
+    
     try:
         token = credentials.credentials
-        payload = verify_token(token)
+        payload = verify_token_cached(token)
         
         if payload is None:
             return None
         
-        email: str = payload.get("sub")
-        if email is None:
-            return None
-        
-        user = await get_user_by_email(db, email=email)
+        user = await _get_user_from_payload(db, payload)
+        if user is not None:
+            request.state.user = user
         return user
     except Exception:
         return None
+
+
+# Request-scoped event lookup
+async def load_event(request: Request, db: AsyncSession, event_id: UUID) -> Optional[Event]:
+    """Load an event at most once per request; concurrent callers await the same query"""
+    events = getattr(request.state, "events", None)
+    if events is None:
+        events = request.state.events = {}
+    
+    pending = events.get(event_id)
+    if pending is None:
+        pending = events[event_id] = asyncio.ensure_future(get_event_by_id(db, event_id))
+    return await pending
+
+
+async def get_event_cached(
+    event_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+) -> Optional[Event]:
+    """Dependency resolving the path's event_id through the request-scoped memo"""
+    return await load_event(request, db, event_id)
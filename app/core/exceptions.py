@@ -1,10 +1,13 @@
+import orjson
 from fastapi import HTTPException, status
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 class EventlyBaseException(Exception):
     """Base exception for Evently application"""
     
+    __slots__ = ("message", "details")
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         self.message = message
         self.details = details or {}
@@ -13,113 +16,116 @@ class EventlyBaseException(Exception):
 
 class ValidationError(EventlyBaseException):
     """Raised when validation fails"""
-    pass
+    __slots__ = ()
 
 
 class NotFoundError(EventlyBaseException):
     """Raised when a resource is not found"""
-    pass
+    __slots__ = ()
 
 
 class ConflictError(EventlyBaseException):
     """Raised when there's a conflict (e.g., duplicate resource)"""
-    pass
+    __slots__ = ()
 
 
 class UnauthorizedError(EventlyBaseException):
     """Raised when user is not authorized"""
-    pass
+    __slots__ = ()
 
 
 class ForbiddenError(EventlyBaseException):
     """Raised when user doesn't have permission"""
-    pass
+    __slots__ = ()
 
 
 class BookingError(EventlyBaseException):
     """Raised when booking operations fail"""
-    pass
+    __slots__ = ()
 
 
 class SeatUnavailableError(BookingError):
     """Raised when requested seats are not available"""
-    pass
+    __slots__ = ()
 
 
 class EventCapacityError(BookingError):
     """Raised when event is at full capacity"""
-    pass
+    __slots__ = ()
 
 
 class PaymentError(EventlyBaseException):
     """Raised when payment processing fails"""
-    pass
+    __slots__ = ()
 
 
 class CacheError(EventlyBaseException):
     """Raised when cache operations fail"""
-    pass
+    __slots__ = ()
 
 
 # HTTP Exception converters
+_BEARER_HEADERS = {"WWW-Authenticate": "Bearer"}
+_INTERNAL_ERROR = (status.HTTP_500_INTERNAL_SERVER_ERROR, None)
+INTERNAL_ERROR_MESSAGE = "An internal server error occurred"
+
+# Exception class -> (status_code, headers). Subclasses not listed here are
+# resolved through their MRO on first use and then cached.
+_EXC_MAP: Dict[type, Tuple[int, Optional[Dict[str, str]]]] = {
+    ValidationError: (status.HTTP_400_BAD_REQUEST, None),
+    NotFoundError: (status.HTTP_404_NOT_FOUND, None),
+    ConflictError: (status.HTTP_409_CONFLICT, None),
+    UnauthorizedError: (status.HTTP_401_UNAUTHORIZED, _BEARER_HEADERS),
+    ForbiddenError: (status.HTTP_403_FORBIDDEN, None),
+    SeatUnavailableError: (status.HTTP_409_CONFLICT, None),
+    EventCapacityError: (status.HTTP_409_CONFLICT, None),
+    BookingError: (status.HTTP_400_BAD_REQUEST, None),
+    PaymentError: (status.HTTP_402_PAYMENT_REQUIRED, None),
+}
+
+
+def _resolve_exc_entry(exc_type: type) -> Tuple[int, Optional[Dict[str, str]]]:
+    """Find the mapping for an unlisted exception class via its MRO and cache it"""
+    for base in exc_type.__mro__[1:]:
+        entry = _EXC_MAP.get(base)
+        if entry is not None:
+            break
+    else:
+        entry = _INTERNAL_ERROR
+    _EXC_MAP[exc_type] = entry
+    return entry
+
+
+class CachedHTTPException(HTTPException):
+    """HTTPException carrying a pre-serialized JSON body for a canned error message"""
+    
+    def __init__(self, status_code: int, message: str, headers: Optional[Dict[str, str]] = None):
+        detail, self.body = _CACHED_ERROR_BODIES[message]
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+
+
 def to_http_exception(exc: EventlyBaseException) -> HTTPException:
     """Convert custom exceptions to HTTP exceptions"""
+    exc_type = type(exc)
+    entry = _EXC_MAP.get(exc_type)
+    if entry is None:
+        entry = _resolve_exc_entry(exc_type)
     
-    if isinstance(exc, ValidationError):
-        return HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"message": exc.message, "details": exc.details}
-        )
-    
-    elif isinstance(exc, NotFoundError):
-        return HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"message": exc.message, "details": exc.details}
-        )
-    
-    elif isinstance(exc, ConflictError):
-        return HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={"message": exc.message, "details": exc.details}
-        )
-    
-    elif isinstance(exc, UnauthorizedError):
-        return HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"message": exc.message, "details": exc.details},
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
-    elif isinstance(exc, ForbiddenError):
-        return HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={"message": exc.message, "details": exc.details}
-        )
-    
-    elif isinstance(exc, (SeatUnavailableError, EventCapacityError)):
-        return HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={"message": exc.message, "details": exc.details}
-        )
-    
-    elif isinstance(exc, BookingError):
-        return HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"message": exc.message, "details": exc.details}
-        )
+    status_code, headers = entry
+    if status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+        # Generic server error for unknown exceptions
+        return CachedHTTPException(status_code, INTERNAL_ERROR_MESSAGE)
     
-    elif isinstance(exc, PaymentError):
-        return HTTPException(
-            status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            detail={"message": exc.message, "details": exc.details}
+    if not exc.details and exc.message in _CACHED_ERROR_BODIES:
+        return CachedHTTPException(
+            status_code, exc.message, headers=dict(headers) if headers else None
         )
     
-    else:
-        # Generic server error for unknown exceptions
-        return HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"message": "An internal server error occurred", "details": {}}
-        )
+    return HTTPException(
+        status_code=status_code,
+        detail={"message": exc.message, "details": exc.details},
+        headers=dict(headers) if headers else None
+    )
 
 
 # Common error messages
@@ -164,3 +170,12 @@ class ErrorMessages:
     DATABASE_ERROR = "Database operation failed"
     EXTERNAL_SERVICE_ERROR = "External service is temporarily unavailable"
     RATE_LIMIT_EXCEEDED = "Rate limit exceeded. Please try again later"
+
+
+# Pre-serialized bodies for canned messages without details: message -> (detail, JSON bytes)
+_CACHED_ERROR_BODIES: Dict[str, Tuple[Dict[str, Any], bytes]] = {}
+for _message in [INTERNAL_ERROR_MESSAGE] + [
+    value for name, value in vars(ErrorMessages).items() if name.isupper()
+]:
+    _detail = {"message": _message, "details": {}}
+    _CACHED_ERROR_BODIES[_message] = (_detail, orjson.dumps(_detail))
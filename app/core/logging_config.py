@@ -0,0 +1,46 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from .monitoring import request_id_var
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each record with the current request id (runs on the calling task)"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Enqueue records as-is. The stock QueueHandler.prepare() formats the message
+    and traceback on the calling thread (to make records picklable); within one
+    process the listener thread can do that work instead of the event loop.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(level: int = logging.INFO) -> QueueListener:
+    """Route all logging through a queue; a background thread formats and writes"""
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(level)
+    
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -1,74 +1,114 @@
+import itertools
+import os
 import time
 import psutil
+from collections import deque, defaultdict
+from contextvars import ContextVar
 from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime
 from fastapi import Request
 from ..db.session import AsyncSessionLocal
 
+# Longest window served by get_average_response_time (minutes)
+STATS_WINDOW_MINUTES = 60
+
+# How long system metrics are reused before psutil is queried again (seconds)
+SYSTEM_METRICS_TTL = 5.0
+DISK_METRICS_TTL = 60.0
+
 
 class PerformanceMonitor:
     """Performance monitoring and metrics collection"""
     
     def __init__(self):
         self.metrics = {}
-        self.request_times = []
         self.max_request_history = 1000
+        # Request history stored as parallel columns; timestamps are
+        # time.monotonic() values
+        self._endpoints = deque(maxlen=self.max_request_history)
+        self._durations = deque(maxlen=self.max_request_history)
+        self._timestamps = deque(maxlen=self.max_request_history)
+        # Per-minute running totals: (minute, {endpoint: [count, total_duration]}),
+        # enough buckets to answer the longest averaging window
+        self._minute_stats = deque(maxlen=STATS_WINDOW_MINUTES)
+        
+        # Cached system metrics (monotonic fetch times)
+        self._sys_cache = None
+        self._sys_cache_ts = 0.0
+        self._disk_cache = None
+        self._disk_cache_ts = 0.0
+        # Prime the CPU counter so later non-blocking calls report a delta
+        psutil.cpu_percent(interval=None)
         
     def record_request_time(self, endpoint: str, duration: float):
         """Record request processing time"""
-        now = datetime.now()
-        self.request_times.append({
-            "endpoint": endpoint,
-            "duration": duration,
-            "timestamp": now
-        })
+        now = time.monotonic()
+        self._endpoints.append(endpoint)
+        self._durations.append(duration)
+        self._timestamps.append(now)
         
-        # Keep only recent requests
-        if len(self.request_times) > self.max_request_history:
-            self.request_times = self.request_times[-self.max_request_history:]
+        minute = int(now // 60)
+        if not self._minute_stats or self._minute_stats[-1][0] != minute:
+            self._minute_stats.append((minute, defaultdict(lambda: [0, 0.0])))
+        stats = self._minute_stats[-1][1][endpoint]
+        stats[0] += 1
+        stats[1] += duration
     
     def get_average_response_time(self, minutes: int = 5) -> Dict[str, float]:
         """Get average response time for the last N minutes"""
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        recent_requests = [
-            req for req in self.request_times 
-            if req["timestamp"] > cutoff
-        ]
-        
-        if not recent_requests:
-            return {}
+        first_minute = int(time.monotonic() // 60) - minutes + 1
         
-        # Group by endpoint
-        endpoint_times = {}
-        for req in recent_requests:
-            endpoint = req["endpoint"]
-            if endpoint not in endpoint_times:
-                endpoint_times[endpoint] = []
-            endpoint_times[endpoint].append(req["duration"])
+        # Sum the per-minute totals: [count, total_duration]
+        totals = defaultdict(lambda: [0, 0.0])
+        for minute, endpoint_stats in reversed(self._minute_stats):
+            if minute < first_minute:
+                break
+            for endpoint, (count, total) in endpoint_stats.items():
+                entry = totals[endpoint]
+                entry[0] += count
+                entry[1] += total
         
-        # Calculate averages
-        averages = {}
-        for endpoint, times in endpoint_times.items():
-            averages[endpoint] = sum(times) / len(times)
-        
-        return averages
+        return {endpoint: total / count for endpoint, (count, total) in totals.items()}
     
     def get_slow_requests(self, threshold: float = 1.0, minutes: int = 5) -> List[Dict]:
         """Get requests that took longer than threshold"""
-        cutoff = datetime.now() - timedelta(minutes=minutes)
-        return [
-            req for req in self.request_times
-            if req["timestamp"] > cutoff and req["duration"] > threshold
-        ]
+        now_monotonic = time.monotonic()
+        now_wall = time.time()
+        cutoff = now_monotonic - minutes * 60
+        
+        # History is in arrival order: walk back from the newest entry and stop
+        # at the window edge instead of scanning the whole buffer
+        slow = []
+        for endpoint, duration, ts in zip(
+            reversed(self._endpoints), reversed(self._durations), reversed(self._timestamps)
+        ):
+            if ts <= cutoff:
+                break
+            if duration > threshold:
+                slow.append({
+                    "endpoint": endpoint,
+                    "duration": duration,
+                    "timestamp": datetime.fromtimestamp(now_wall - (now_monotonic - ts))
+                })
+        slow.reverse()
+        return slow
     
     def get_system_metrics(self) -> Dict[str, Any]:
-        """Get current system performance metrics"""
+        """Get current system performance metrics (cached briefly)"""
+        now = time.monotonic()
+        if self._sys_cache is not None and now - self._sys_cache_ts < SYSTEM_METRICS_TTL:
+            return self._sys_cache
+        
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: CPU usage since the previous call
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            if self._disk_cache is None or now - self._disk_cache_ts >= DISK_METRICS_TTL:
+                self._disk_cache = psutil.disk_usage('/')
+                self._disk_cache_ts = now
+            disk = self._disk_cache
             
-            return {
+            self._sys_cache = {
                 "cpu_percent": cpu_percent,
                 "memory_percent": memory.percent,
                 "memory_available_gb": memory.available / (1024**3),
@@ -76,6 +116,8 @@ class PerformanceMonitor:
                 "disk_free_gb": disk.free / (1024**3),
                 "timestamp": datetime.now().isoformat()
             }
+            self._sys_cache_ts = now
+            return self._sys_cache
         except Exception as e:
             return {"error": str(e), "timestamp": datetime.now().isoformat()}
 
@@ -108,21 +150,16 @@ class DatabaseMonitor:
     
     @staticmethod
     async def get_table_sizes() -> Dict[str, Any]:
-        """Get approximate table sizes (SQLite specific)"""
+        """Get table row counts in a single round-trip"""
         try:
             async with AsyncSessionLocal() as db:
-                # SQLite specific queries
+                from sqlalchemy import text
                 tables = ["users", "events", "seats", "bookings", "tickets", "waitlist_entries"]
-                sizes = {}
-                
-                for table in tables:
-                    try:
-                        from sqlalchemy import text
-                        result = await db.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                        count = result.scalar()
-                        sizes[table] = count
-                    except Exception:
-                        sizes[table] = "error"
+                sql = "SELECT " + ", ".join(
+                    f"(SELECT COUNT(*) FROM {table}) AS {table}" for table in tables
+                )
+                row = (await db.execute(text(sql))).first()
+                sizes = dict(zip(tables, row))
                 
                 return {
                     "table_sizes": sizes,
@@ -139,7 +176,7 @@ class CacheMonitor:
     """Cache performance monitoring"""
     
     @staticmethod
-    def get_cache_stats() -> Dict[str, Any]:
+    async def get_cache_stats() -> Dict[str, Any]:
         """Get cache performance statistics"""
         try:
             from ..services.cache import redis_client, REDIS_AVAILABLE
@@ -150,7 +187,7 @@ class CacheMonitor:
                     "message": "Redis not available"
                 }
             
-            info = redis_client.info()
+            info = await redis_client.info()
             
             return {
                 "available": True,
@@ -177,6 +214,16 @@ class CacheMonitor:
             }
 
 
+# Request IDs: per-process prefix plus a monotonically increasing counter
+_REQUEST_ID_PREFIX = f"req_{os.getpid():x}_"
+_next_request_number = itertools.count(1).__next__
+
+# Per-request identifiers, set once by PerformanceMiddleware and readable from
+# inner middlewares, handlers and log calls without going through request.state
+request_id_var: ContextVar[str] = ContextVar("request_id", default="unknown")
+client_ip_var: ContextVar[str] = ContextVar("client_ip", default="unknown")
+
+
 class PerformanceMiddleware:
     """Middleware to track request performance"""
     
@@ -188,19 +235,28 @@ class PerformanceMiddleware:
         start_time = time.time()
         
         # Add request ID for tracing
-        request.state.request_id = f"req_{int(time.time() * 1000)}_{id(request)}"
+        request_id = f"{_REQUEST_ID_PREFIX}{_next_request_number():x}"
+        request_id_var.set(request_id)
+        
+        # Resolve the client IP once for the inner middlewares
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        if forwarded_for:
+            # Use first IP in case of multiple proxies
+            client_ip_var.set(forwarded_for.split(",", 1)[0].strip())
+        else:
+            client_ip_var.set(request.client.host if request.client else "unknown")
+        endpoint = f"{request.method} {request.url.path}"
         
         response = await call_next(request)
         
         process_time = time.time() - start_time
         
         # Record metrics
-        endpoint = f"{request.method} {request.url.path}"
         self.monitor.record_request_time(endpoint, process_time)
         
         # Add performance headers
         response.headers["X-Process-Time"] = str(process_time)
-        response.headers["X-Request-ID"] = request.state.request_id
+        response.headers["X-Request-ID"] = request_id
         
         return response
 
@@ -237,7 +293,7 @@ class HealthChecker:
         
         # Cache health
         try:
-            cache_stats = CacheMonitor.get_cache_stats()
+            cache_stats = await CacheMonitor.get_cache_stats()
             health_status["checks"]["cache"] = {
                 "status": "healthy" if cache_stats.get("available") else "degraded",
                 "details": cache_stats
@@ -1,23 +1,51 @@
 from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Callable, Dict, Any
+import asyncio
+import logging
 import time
 import re
+from collections import deque
 from functools import wraps
 from ..services.cache import CacheService, REDIS_AVAILABLE
 from ..core.exceptions import EventlyBaseException
+from ..core.monitoring import client_ip_var
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the Redis round-trip before a request is let through
+REDIS_TIMEOUT_SECONDS = 0.05
+
+# Paths that are never rate limited (health checks and API docs)
+NO_LIMIT_PATHS = frozenset({
+    "/", "/health", "/monitoring/health/basic",
+    "/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json", "/favicon.ico",
+})
+
+# Rate limiting errors are logged at most once per interval (seconds)
+ERROR_LOG_INTERVAL = 1.0
+_last_error_logged_at = 0.0
+
+
+def _log_rate_limit_error(message: str):
+    """Log a rate limiting failure, throttled so an outage doesn't flood the log"""
+    global _last_error_logged_at
+    now = time.monotonic()
+    if now - _last_error_logged_at >= ERROR_LOG_INTERVAL:
+        _last_error_logged_at = now
+        logger.warning(message, exc_info=True)
 
 
 class RateLimitExceeded(EventlyBaseException):
     """Raised when rate limit is exceeded"""
-    pass
+    __slots__ = ()
 
 
 class RateLimiter:
     """Rate limiter using sliding window algorithm"""
     
-    def __init__(self, calls: int, period: int, per: str = "minute"):
+    def __init__(self, calls: int, period: int, per: str = "minute", bucket: str = "default"):
         """
         Initialize rate limiter
         
@@ -25,17 +53,35 @@ class RateLimiter:
             calls: Number of allowed calls
             period: Time period 
             per: Time unit ('second', 'minute', 'hour')
+            bucket: Field name of this limiter's counter in the client's hash
         """
         self.calls = calls
         self.period = period
+        self.bucket = bucket
         
         # Convert to seconds
         multipliers = {"second": 1, "minute": 60, "hour": 3600}
         self.period_seconds = period * multipliers.get(per, 60)
+        
+        # Pre-encoded X-RateLimit-Limit header value
+        self.calls_header = str(calls).encode()
+        
+        # Shared fail-open result (treat as read-only)
+        self._allow_all = (True, {"remaining": calls, "reset_time": 0})
+        if not REDIS_AVAILABLE:
+            # Redis availability is fixed at import time; skip the check per call
+            self.is_allowed = self._always_allow
+    
+    async def _always_allow(self, identifier: str) -> tuple[bool, Dict[str, Any]]:
+        """Allow every request (used when Redis is not available)"""
+        return self._allow_all
     
     def _get_key(self, identifier: str) -> str:
-        """Generate cache key for rate limiting"""
-        return f"rate_limit:{identifier}"
+        """
+        Generate cache key for rate limiting.
+        One hash per client and window length; each limiter is a field in it.
+        """
+        return f"rl:{self.period_seconds}:{identifier}"
     
     def _get_window_start(self) -> int:
         """Get current time window start"""
@@ -49,59 +95,26 @@ class RateLimiter:
         Returns:
             (is_allowed, info_dict)
         """
-        if not REDIS_AVAILABLE:
-            # If Redis is not available, allow all requests
-            return True, {"remaining": self.calls, "reset_time": 0}
+        key = self._get_key(identifier)
+        reset_time = self._get_window_start() + self.period_seconds
         
+        # Single atomic round-trip; the window TTL starts with the first request.
+        # Fail open if Redis is slow rather than stalling the request.
         try:
-            key = self._get_key(identifier)
-            current_time = int(time.time())
-            window_start = self._get_window_start()
-            
-            # Get current count from cache with proper error handling
-            try:
-                current_count = CacheService.get(key)
-                if current_count is None:
-                    current_count = 0
-                else:
-                    current_count = int(current_count)
-            except Exception:
-                current_count = 0
-            
-            # Check if we're in a new window
-            if current_count == 0:
-                # New window, start counting
-                try:
-                    CacheService.set(key, 1, expire=self.period_seconds)
-                except Exception:
-                    pass  # If cache fails, allow request
-                return True, {
-                    "remaining": self.calls - 1,
-                    "reset_time": window_start + self.period_seconds
-                }
-            
-            if current_count >= self.calls:
-                # Rate limit exceeded
-                return False, {
-                    "remaining": 0,
-                    "reset_time": window_start + self.period_seconds
-                }
-            
-            # Increment counter
-            try:
-                CacheService.set(key, current_count + 1, expire=self.period_seconds)
-            except Exception:
-                pass  # If cache fails, allow request
-            
-            return True, {
-                "remaining": self.calls - (current_count + 1),
-                "reset_time": window_start + self.period_seconds
-            }
-            
-        except Exception as e:
-            # If rate limiting fails, allow the request
-            print(f"Rate limiting error: {e}")
-            return True, {"remaining": self.calls, "reset_time": 0}
+            count = await asyncio.wait_for(
+                CacheService.hincr_with_expiry(key, self.bucket, self.period_seconds),
+                timeout=REDIS_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            count = None
+        
+        if count is None:
+            return self._allow_all
+        
+        return count <= self.calls, {
+            "remaining": max(0, self.calls - count),
+            "reset_time": reset_time
+        }
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -129,40 +142,49 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         # Default rate limit for unspecified endpoints
         self.default_limit = RateLimiter(calls=60, period=1, per="minute")
+        
+        # Match all patterns in a single pass; alternatives are tried in the
+        # order above, so more specific patterns must come first
+        self._combined_pattern = re.compile("|".join(
+            f"(?P<g{i}>{pattern})" for i, pattern in enumerate(self.limits)
+        ))
+        self._limiters_by_group = {
+            f"g{i}": limiter for i, limiter in enumerate(self.limits.values())
+        }
+        
+        # Short per-pattern field names for the per-client counter hashes
+        for group, limiter in self._limiters_by_group.items():
+            limiter.bucket = group
     
     def _get_client_identifier(self, request: Request) -> str:
         """Get client identifier for rate limiting"""
-        # Try to get user ID from authentication
-        # For now, use IP address as fallback
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            # Use first IP in case of multiple proxies
-            client_ip = forwarded_for.split(",")[0].strip()
-        else:
-            client_ip = request.client.host if request.client else "unknown"
-        
-        return client_ip
+        # Client IP is resolved once by PerformanceMiddleware
+        return client_ip_var.get()
     
     def _get_rate_limiter(self, path: str) -> RateLimiter:
         """Get appropriate rate limiter for the path"""
-        for pattern, limiter in self.limits.items():
-            if re.match(pattern, path):
-                return limiter
+        match = self._combined_pattern.match(path)
+        if match:
+            return self._limiters_by_group[match.lastgroup]
         
         return self.default_limit
     
     async def dispatch(self, request: Request, call_next):
         """Apply rate limiting to request"""
+        path = request.url.path
+        if path in NO_LIMIT_PATHS or request.method == "OPTIONS":
+            # Health checks, docs and CORS preflights skip rate limiting
+            return await call_next(request)
+        
         try:
-            path = request.url.path
             client_id = self._get_client_identifier(request)
             rate_limiter = self._get_rate_limiter(path)
             
             # Check rate limit
-            is_allowed, info = await rate_limiter.is_allowed(f"{path}:{client_id}")
+            is_allowed, info = await rate_limiter.is_allowed(client_id)
             
             if not is_allowed:
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     content={
                         "message": "Rate limit exceeded",
@@ -178,16 +200,18 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # Process request
             response = await call_next(request)
             
-            # Add rate limit headers to response
-            response.headers["X-RateLimit-Limit"] = str(rate_limiter.calls)
-            response.headers["X-RateLimit-Remaining"] = str(info["remaining"])
-            response.headers["X-RateLimit-Reset"] = str(info["reset_time"])
+            # Add rate limit headers to response (raw, already lower-cased/encoded)
+            response.raw_headers.extend((
+                (b"x-ratelimit-limit", rate_limiter.calls_header),
+                (b"x-ratelimit-remaining", b"%d" % info["remaining"]),
+                (b"x-ratelimit-reset", b"%d" % info["reset_time"]),
+            ))
             
             return response
             
-        except Exception as e:
+        except Exception:
             # If rate limiting fails, continue with request
-            print(f"Rate limiting middleware error: {e}")
+            _log_rate_limit_error("Rate limiting middleware error")
             return await call_next(request)
 
 
@@ -202,7 +226,7 @@ def rate_limit(calls: int, period: int, per: str = "minute"):
             pass
     """
     def decorator(func: Callable) -> Callable:
-        limiter = RateLimiter(calls, period, per)
+        limiter = RateLimiter(calls, period, per, bucket=f"fn:{func.__name__}")
         
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -218,9 +242,8 @@ def rate_limit(calls: int, period: int, per: str = "minute"):
                 return await func(*args, **kwargs)
             
             client_id = request.client.host if request.client else "unknown"
-            key = f"{func.__name__}:{client_id}"
             
-            is_allowed, info = await limiter.is_allowed(key)
+            is_allowed, info = await limiter.is_allowed(client_id)
             
             if not is_allowed:
                 raise HTTPException(
@@ -242,31 +265,42 @@ class IPRateLimiter:
     """Simple IP-based rate limiter for security purposes"""
     
     def __init__(self):
-        self.attempts = {}  # In-memory storage for simplicity
+        self.attempts: Dict[str, deque] = {}  # In-memory storage for simplicity
         self.max_attempts = 10
         self.window_size = 300  # 5 minutes
+        self.cleanup_interval = 1000  # Calls between sweeps of stale IPs
+        self._calls = 0
     
     def is_ip_allowed(self, ip: str) -> bool:
         """Check if IP is allowed based on recent attempts"""
-        now = time.time()
+        now = time.monotonic()
         
-        if ip not in self.attempts:
-            self.attempts[ip] = []
+        self._calls += 1
+        if self._calls % self.cleanup_interval == 0:
+            self._evict_stale(now)
         
-        # Clean old attempts
-        self.attempts[ip] = [
-            attempt_time for attempt_time in self.attempts[ip]
-            if now - attempt_time < self.window_size
-        ]
+        attempts = self.attempts.get(ip)
+        if attempts is None:
+            attempts = self.attempts[ip] = deque(maxlen=self.max_attempts)
         
-        # Check if under limit
-        if len(self.attempts[ip]) >= self.max_attempts:
+        # Only the last max_attempts are kept, so the limit is hit when the
+        # oldest of them is still inside the window
+        if len(attempts) == self.max_attempts and now - attempts[0] < self.window_size:
             return False
         
         # Record this attempt
-        self.attempts[ip].append(now)
+        attempts.append(now)
         return True
     
+    def _evict_stale(self, now: float):
+        """Drop IPs whose most recent attempt is outside the window"""
+        stale = [
+            ip for ip, attempts in self.attempts.items()
+            if not attempts or now - attempts[-1] >= self.window_size
+        ]
+        for ip in stale:
+            del self.attempts[ip]
+    
     def clear_ip(self, ip: str):
         """Clear attempts for an IP (e.g., after successful auth)"""
         if ip in self.attempts:
@@ -1,3 +1,6 @@
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
@@ -6,6 +9,10 @@ from .config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Resolved once at import: the HMAC key as bytes and the accepted algorithm list
+_SECRET_KEY_BYTES = settings.secret_key.encode()
+_ALGORITHMS = [settings.algorithm]
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -15,7 +22,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=settings.algorithm)
     return encoded_jwt
 
 
@@ -23,13 +30,71 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Positive password checks only: (email, password, stored hash) digest -> expiry.
+# Failed checks are never cached, and a changed hash never matches an old key.
+_PASSWORD_VERIFY_CACHE_MAX = 10000
+_verified_passwords: "OrderedDict[bytes, float]" = OrderedDict()
+
+
+def verify_password_cached(email: str, plain_password: str, hashed_password: str) -> bool:
+    """verify_password, reusing recent successful results when the cache is enabled"""
+    if not settings.password_verify_cache_enabled:
+        return verify_password(plain_password, hashed_password)
+    
+    key = hashlib.blake2b(
+        b"|".join((email.encode(), plain_password.encode(), hashed_password.encode())),
+        digest_size=16
+    ).digest()
+    now = time.monotonic()
+    expires_at = _verified_passwords.get(key)
+    if expires_at is not None and expires_at > now:
+        return True
+    
+    if not verify_password(plain_password, hashed_password):
+        return False
+    
+    _verified_passwords[key] = now + settings.password_verify_cache_ttl
+    _verified_passwords.move_to_end(key)
+    if len(_verified_passwords) > _PASSWORD_VERIFY_CACHE_MAX:
+        _verified_passwords.popitem(last=False)
+    return True
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
 def verify_token(token: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=_ALGORITHMS)
         return payload
     except jwt.JWTError:
         return None
+
+
+# Decoded payloads of valid tokens: token digest -> (payload, cache expiry as
+# wall-clock seconds). Entries never outlive the token's own exp claim.
+_TOKEN_VERIFY_CACHE_MAX = 8192
+_verified_tokens: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """verify_token, reusing the decoded payload of recently verified tokens"""
+    if settings.token_verify_cache_ttl <= 0:
+        return verify_token(token)
+    
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    cached = _verified_tokens.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    
+    payload = verify_token(token)
+    if payload is None:
+        return None
+    
+    _verified_tokens[key] = (payload, min(now + settings.token_verify_cache_ttl, payload.get("exp", now)))
+    _verified_tokens.move_to_end(key)
+    if len(_verified_tokens) > _TOKEN_VERIFY_CACHE_MAX:
+        _verified_tokens.popitem(last=False)
+    return payload
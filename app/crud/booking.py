@@ -1,55 +1,111 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
-from typing import Optional, List
+from sqlalchemy import select, update, and_, func, lambda_stmt
+from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Optional, List, Tuple
 from uuid import UUID
-import uuid
+from datetime import datetime
+import os
 import logging
-from ..models.models import Booking, Ticket, Seat, SeatStatus, BookingStatus
+from ..models.models import Booking, Ticket, Seat, SeatStatus, BookingStatus, Event
 
 logger = logging.getLogger(__name__)
 
-async def create_booking_with_seats(
+async def get_event_and_lock_seats(
     db: AsyncSession,
-    user_id: UUID,
     event_id: UUID,
-    seat_identifiers: List[str],
-    base_price_per_ticket: float,
-    final_price_per_ticket: float,
-    price_multiplier: float,
-    total_amount: float
-) -> Booking:
+    seat_identifiers: List[str]
+) -> Tuple[Tuple[float, datetime], list]:
     """
-    Create a booking with pessimistic locking.
+    Claim the requested seats and read the event's pricing inputs in one round-trip.
+    Returns ((base_price, start_time), claimed_seats) where each claimed seat row
+    has id/seat_identifier. Raises ValueError if the event or any seat is missing
+    or already taken.
     NO COMMIT here; caller (service layer) is responsible for commit/rollback.
     """
-    # Lock the seats first
-    seat_query = (
-        select(Seat)
+    # Claim the seats in one atomic statement; only AVAILABLE seats are updated
+    # and RETURNING tells us which ones we actually got. SKIP LOCKED treats a
+    # seat held by a concurrent booking as taken, so overlapping bookings fail
+    # fast instead of queueing on each other's row locks (and can't deadlock).
+    # UPDATE ... FROM events returns the pricing columns alongside the seats,
+    # so there is no separate event lookup. It runs as a Core statement on the
+    # tables: the ORM bulk UPDATE path cannot map RETURNING columns of events.
+    seats = Seat.__table__
+    events = Event.__table__
+    # Book each seat once; duplicates would otherwise fail the claimed-count check
+    seat_identifiers = list(dict.fromkeys(seat_identifiers))
+    requested = set(seat_identifiers)
+    requested_list = sorted(requested)
+    locked_seats = (
+        select(seats.c.id)
         .where(
             and_(
-                Seat.event_id == event_id,
-                Seat.seat_identifier.in_(seat_identifiers)
+                seats.c.event_id == event_id,
+                seats.c.seat_identifier.in_(requested_list),
+                seats.c.status == SeatStatus.AVAILABLE
             )
         )
-        .with_for_update()
+        .with_for_update(skip_locked=True)
+        .subquery()
     )
-    result = await db.execute(seat_query)
-    locked_seats = result.scalars().all()
+    claim_stmt = (
+        update(seats)
+        .where(
+            and_(
+                seats.c.id == locked_seats.c.id,
+                seats.c.status == SeatStatus.AVAILABLE,
+                events.c.id == seats.c.event_id
+            )
+        )
+        .values(status=SeatStatus.BOOKED)
+        .returning(seats.c.id, seats.c.seat_identifier, events.c.base_price, events.c.start_time)
+    )
+    result = await db.execute(claim_stmt)
+    claimed_seats = result.all()
 
-    if len(locked_seats) != len(seat_identifiers):
-        found = {s.seat_identifier for s in locked_seats}
-        missing = sorted(set(seat_identifiers) - found)
-        raise ValueError(f"Seats not found: {missing}")
+    if len(claimed_seats) != len(seat_identifiers):
+        # Failure path only: find out whether the event exists and which seats
+        # are missing vs. taken. The caller rolls back, releasing any seats
+        # claimed above.
+        existing_result = await db.execute(
+            select(Event.id, Seat.seat_identifier)
+            .outerjoin(
+                Seat,
+                and_(
+                    Seat.event_id == Event.id,
+                    Seat.seat_identifier.in_(requested_list)
+                )
+            )
+            .where(Event.id == event_id)
+        )
+        existing = existing_result.all()
+        if not existing:
+            raise ValueError("Event not found")
+        found = {row.seat_identifier for row in existing if row.seat_identifier is not None}
+        missing = sorted(requested - found)
+        if missing:
+            raise ValueError(f"Seats not found: {missing}")
+        claimed = {seat.seat_identifier for seat in claimed_seats}
+        raise ValueError(f"Seats no longer available: {sorted(requested - claimed)}")
 
-    unavailable = [s.seat_identifier for s in locked_seats if s.status != SeatStatus.AVAILABLE]
-    if unavailable:
-        raise ValueError(f"Seats no longer available: {sorted(unavailable)}")
+    first = claimed_seats[0]
+    return (first.base_price, first.start_time), claimed_seats
 
-    # Update seat status
-    for seat in locked_seats:
-        seat.status = SeatStatus.BOOKED
 
+async def create_booking_with_seats(
+    db: AsyncSession,
+    user_id: UUID,
+    event_id: UUID,
+    claimed_seats,
+    base_price_per_ticket: float,
+    final_price_per_ticket: float,
+    price_multiplier: float,
+    total_amount: float
+) -> Booking:
+    """
+    Create a booking and its tickets for seats already claimed by get_event_and_lock_seats.
+    NO COMMIT here; caller (service layer) is responsible for commit/rollback.
+    """
     # Create booking
     booking = Booking(
         user_id=user_id,
@@ -63,29 +119,25 @@ async def create_booking_with_seats(
     db.add(booking)
     await db.flush()  # Get booking.id
 
-    # Create tickets
-    tickets: List[Ticket] = []
-    for seat in locked_seats:
-        ticket = Ticket(
+    # Create tickets; one urandom read supplies the 8-hex-char suffix for every QR code
+    random_hex = os.urandom(4 * len(claimed_seats)).hex()
+    tickets: List[Ticket] = [
+        Ticket(
             booking_id=booking.id,
             seat_id=seat.id,
-            qr_code_data=f"booking_{booking.id}_seat_{seat.id}_{uuid.uuid4().hex[:8]}"
+            qr_code_data=f"booking_{booking.id}_seat_{seat.id}_{random_hex[i * 8:(i + 1) * 8]}"
         )
-        tickets.append(ticket)
+        for i, seat in enumerate(claimed_seats)
+    ]
     
     db.add_all(tickets)
     await db.flush()  # Get ticket IDs
     
-    # Refresh the booking with tickets loaded to avoid lazy loading issues
-    await db.refresh(booking)
-    result = await db.execute(
-        select(Booking)
-        .options(selectinload(Booking.tickets))
-        .where(Booking.id == booking.id)
-    )
-    booking_with_tickets = result.scalar_one()
+    # The tickets were just created in this session; mark them as the loaded
+    # collection instead of re-selecting the booking
+    set_committed_value(booking, "tickets", tickets)
     
-    return booking_with_tickets
+    return booking
 
 
 async def get_user_bookings(
@@ -107,13 +159,14 @@ async def get_user_bookings(
 
 
 async def get_booking_by_id(db: AsyncSession, booking_id: UUID) -> Optional[Booking]:
-    """Get booking by ID with tickets"""
-    result = await db.execute(
-        select(Booking)
-        .options(selectinload(Booking.tickets))
+    """Get booking by ID with tickets (single LEFT JOIN round-trip)"""
+    # lambda_stmt caches the constructed statement; only the bound booking_id varies
+    result = await db.execute(lambda_stmt(
+        lambda: select(Booking)
+        .options(joinedload(Booking.tickets))
         .where(Booking.id == booking_id)
-    )
-    return result.scalar_one_or_none()
+    ))
+    return result.unique().scalar_one_or_none()
 
 
 async def cancel_booking(
@@ -128,27 +181,31 @@ async def cancel_booking(
     try:
         result = await db.execute(
             select(Booking)
-            .options(
-                selectinload(Booking.tickets).selectinload(Ticket.seat),
-                selectinload(Booking.event)
-            )
+            .options(joinedload(Booking.tickets))
             .where(and_(Booking.id == booking_id, Booking.user_id == user_id))
         )
-        booking = result.scalar_one_or_none()
+        booking = result.unique().scalar_one_or_none()
         if not booking:
             return None
 
         if booking.status == BookingStatus.CANCELLED:
             return booking  # Idempotent
 
-        # Release seats
-        for ticket in booking.tickets:
-            if ticket.seat and ticket.seat.status == SeatStatus.BOOKED:
-                ticket.seat.status = SeatStatus.AVAILABLE
+        # Release seats in one statement instead of loading and flushing each seat
+        await db.execute(
+            update(Seat)
+            .where(
+                and_(
+                    Seat.id.in_(select(Ticket.seat_id).where(Ticket.booking_id == booking.id)),
+                    Seat.status == SeatStatus.BOOKED
+                )
+            )
+            .values(status=SeatStatus.AVAILABLE)
+            .execution_options(synchronize_session=False)
+        )
 
         booking.status = BookingStatus.CANCELLED
         await db.commit()
-        await db.refresh(booking)
         return booking
     except Exception as e:
         await db.rollback()
@@ -158,42 +215,52 @@ async def cancel_booking(
 
 async def get_booking_analytics(db: AsyncSession) -> dict:
     """Get booking analytics"""
-    # Total bookings
-    total_bookings_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.status == BookingStatus.CONFIRMED)
-    )
-    total_bookings = total_bookings_result.scalar() or 0
+    confirmed = Booking.status == BookingStatus.CONFIRMED
     
-    # Revenue calculation using actual amounts paid (with dynamic pricing)
-    revenue_result = await db.execute(
-        select(func.sum(Booking.total_amount))
-        .where(Booking.status == BookingStatus.CONFIRMED)
-    )
-    total_revenue = revenue_result.scalar() or 0.0
-    
-    # Total tickets count
-    total_tickets_result = await db.execute(
+    # Total tickets count (scalar subquery so the booking aggregates aren't fanned out by the join)
+    total_tickets_subq = (
         select(func.count(Ticket.id))
         .join(Booking)
-        .where(Booking.status == BookingStatus.CONFIRMED)
+        .where(confirmed)
+        .scalar_subquery()
     )
-    total_tickets = total_tickets_result.scalar() or 0
+    
+    # Total bookings, revenue (actual amounts paid, with dynamic pricing) and tickets in one query
+    result = await db.execute(
+        select(
+            func.count(Booking.id),
+            func.sum(Booking.total_amount),
+            total_tickets_subq
+        ).where(confirmed)
+    )
+    total_bookings, total_revenue, total_tickets = result.one()
     
     return {
-        "total_bookings": total_bookings,
-        "total_revenue": float(total_revenue),
-        "total_tickets": total_tickets
+        "total_bookings": total_bookings or 0,
+        "total_revenue": float(total_revenue or 0.0),
+        "total_tickets": total_tickets or 0
     }
 
 
 async def get_pricing_analytics(db: AsyncSession) -> dict:
     """Get analytics on dynamic pricing impact"""
     
-    # Total bookings
-    total_bookings_result = await db.execute(
-        select(func.count(Booking.id)).where(Booking.status == BookingStatus.CONFIRMED)
+    # All confirmed-booking aggregates in a single scan:
+    # - bookings with surge pricing (multiplier > 1.0)
+    # - actual revenue (what customers paid)
+    # - base price revenue, using total_amount / price_multiplier to get
+    #   what would have been paid at base price
+    result = await db.execute(
+        select(
+            func.count(Booking.id),
+            func.count(Booking.id).filter(Booking.price_multiplier > 1.0),
+            func.avg(Booking.price_multiplier),
+            func.sum(Booking.total_amount),
+            func.sum(Booking.total_amount / Booking.price_multiplier)
+        ).where(Booking.status == BookingStatus.CONFIRMED)
     )
-    total_bookings = total_bookings_result.scalar() or 0
+    total_bookings, surge_bookings, avg_multiplier, actual_revenue, base_price_revenue = result.one()
+    total_bookings = total_bookings or 0
     
     if total_bookings == 0:
         return {
@@ -206,48 +273,20 @@ async def get_pricing_analytics(db: AsyncSession) -> dict:
             "surge_percentage": 0.0
         }
     
-    # Bookings with surge pricing (multiplier > 1.0)
-    surge_bookings_result = await db.execute(
-        select(func.count(Booking.id))
-        .where(
-            and_(
-                Booking.status == BookingStatus.CONFIRMED,
-                Booking.price_multiplier > 1.0
-            )
-        )
-    )
-    surge_bookings = surge_bookings_result.scalar() or 0
+    surge_bookings = surge_bookings or 0
     
     # Bookings at base price (multiplier = 1.0)
     base_price_bookings = total_bookings - surge_bookings
     
-    # Average price multiplier
-    avg_multiplier_result = await db.execute(
-        select(func.avg(Booking.price_multiplier))
-        .where(Booking.status == BookingStatus.CONFIRMED)
-    )
-    avg_multiplier = float(avg_multiplier_result.scalar() or 1.0)
-    
-    # Actual revenue (what customers paid)
-    actual_revenue_result = await db.execute(
-        select(func.sum(Booking.total_amount))
-        .where(Booking.status == BookingStatus.CONFIRMED)
-    )
-    actual_revenue = float(actual_revenue_result.scalar() or 0.0)
-    
-    # Base price revenue calculation using the total_amount / price_multiplier
-    # This gives us what would have been paid at base price
-    base_revenue_result = await db.execute(
-        select(func.sum(Booking.total_amount / Booking.price_multiplier))
-        .where(Booking.status == BookingStatus.CONFIRMED)
-    )
-    base_price_revenue = float(base_revenue_result.scalar() or 0.0)
+    avg_multiplier = float(avg_multiplier or 1.0)
+    actual_revenue = float(actual_revenue or 0.0)
+    base_price_revenue = float(base_price_revenue or 0.0)
     
     # Total surge revenue (extra revenue from dynamic pricing)
     total_surge_revenue = actual_revenue - base_price_revenue
     
     # Surge percentage
-    surge_percentage = (surge_bookings / total_bookings * 100) if total_bookings > 0 else 0.0
+    surge_percentage = surge_bookings / total_bookings * 100
     
     return {
         "total_bookings_with_surge": surge_bookings,
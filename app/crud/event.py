@@ -1,12 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_, func
-from typing import Optional, List
+from sqlalchemy import select, update, and_, func, desc, text
+from typing import Optional, List, AsyncIterator
 from datetime import datetime, timezone
 from uuid import UUID
-from sqlalchemy import exc as sa_exc
-from ..models.models import Event, Seat, SeatStatus
-from sqlalchemy import select, func, desc
-from ..models.models import Booking, BookingStatus, Event, Ticket
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from ..db.session import engine
+from ..models.models import Event, Seat, SeatStatus, Booking, BookingStatus, Ticket
 
 
 async def create_event(
@@ -31,7 +30,6 @@ async def create_event(
     )
     db.add(db_event)
     await db.commit()
-    await db.refresh(db_event)
     return db_event
 
 
@@ -61,6 +59,11 @@ async def get_events(
     return result.scalars().all()
 
 
+async def count_events(db: AsyncSession) -> int:
+    """Count all events"""
+    return await db.scalar(select(func.count()).select_from(Event)) or 0
+
+
 async def update_event(
     db: AsyncSession,
     event_id: UUID,
@@ -70,13 +73,18 @@ async def update_event(
     if not update_data:
         return await get_event_by_id(db, event_id)
     
-    await db.execute(
+    # UPDATE ... RETURNING refreshes the event in the same transaction,
+    # instead of re-selecting it after the commit
+    result = await db.execute(
         update(Event)
         .where(Event.id == event_id)
         .values(**update_data)
+        .returning(Event)
+        .execution_options(populate_existing=True)
     )
+    event = result.scalar_one_or_none()
     await db.commit()
-    return await get_event_by_id(db, event_id)
+    return event
 
 
 async def delete_event(db: AsyncSession, event_id: UUID) -> bool:
@@ -94,32 +102,23 @@ async def delete_event(db: AsyncSession, event_id: UUID) -> bool:
 
 
 async def create_seats_for_event(db: AsyncSession, event_id: UUID, seat_identifiers: List[str]) -> List[Seat]:
-    """Create seats for an event, skipping existing (idempotent)."""
+    """Create seats for an event, skipping existing (idempotent). Returns only the new seats."""
     if not seat_identifiers:
         return []
     
-    # Fetch existing seat identifiers for this event
-    existing_result = await db.execute(
-        select(Seat.seat_identifier).where(
-            and_(Seat.event_id == event_id, Seat.seat_identifier.in_(seat_identifiers))
-        )
+    # ON CONFLICT on uq_event_seat skips seats that already exist, including ones
+    # inserted concurrently, so there is no existence pre-check to race against
+    result = await db.scalars(
+        pg_insert(Seat)
+        .on_conflict_do_nothing(index_elements=["event_id", "seat_identifier"])
+        .returning(Seat),
+        [
+            {"event_id": event_id, "seat_identifier": sid, "status": SeatStatus.AVAILABLE}
+            for sid in dict.fromkeys(seat_identifiers)
+        ]
     )
-    existing = {row[0] for row in existing_result.all()}
-    new_ids = [sid for sid in seat_identifiers if sid not in existing]
-    
-    seats = [
-        Seat(event_id=event_id, seat_identifier=sid, status=SeatStatus.AVAILABLE)
-        for sid in new_ids
-    ]
-    if not seats:
-        return []
-    
-    db.add_all(seats)
-    try:
-        await db.commit()
-    except sa_exc.IntegrityError:
-        await db.rollback()
-        raise
+    seats = result.all()
+    await db.commit()
     return seats
 
 
@@ -131,10 +130,21 @@ async def get_event_seats(db: AsyncSession, event_id: UUID) -> List[Seat]:
     return result.scalars().all()
 
 
+async def get_event_seat_rows(db: AsyncSession, event_id: UUID):
+    """Get (id, seat_identifier, status) rows for an event's seats, without ORM objects"""
+    result = await db.execute(
+        select(Seat.id, Seat.seat_identifier, Seat.status)
+        .where(Seat.event_id == event_id)
+        .order_by(Seat.id)
+    )
+    return result.all()
+
+
 async def get_available_seats_count(db: AsyncSession, event_id: UUID) -> int:
     """Count available seats for an event"""
+    # count(*) lets Postgres answer from ix_seats_event_available alone
     result = await db.execute(
-        select(func.count(Seat.id)).where(
+        select(func.count()).select_from(Seat).where(
             and_(Seat.event_id == event_id, Seat.status == SeatStatus.AVAILABLE)
         )
     )
@@ -161,40 +171,42 @@ async def get_popular_events_stats(db: AsyncSession, limit: int = 10):
     return result.all()
 
 
-async def get_daily_booking_trends(
-    db: AsyncSession,
-    days: int = 30
-):
+async def stream_daily_booking_trends(days: int = 30) -> AsyncIterator[dict]:
     """
-    Returns list of (day, bookings, revenue) for the last `days` (inclusive today).
-    Missing days will be synthesized with zeros.
+    Yields (day, bookings, revenue) rows for the last `days` (inclusive today).
+    Missing days are filled with zeros by generate_series in SQL.
+    Rows are streamed from a server-side cursor on a dedicated connection, so the
+    generator can outlive the request's session (e.g. inside a StreamingResponse).
     """
     from datetime import datetime, timedelta, timezone
     end_date = datetime.now(timezone.utc).date()
     start_date = end_date - timedelta(days=days - 1)
 
-    # Aggregate bookings per day with actual amounts paid (including dynamic pricing)
-    stmt = (
-        select(
-            func.date(Booking.created_at).label("day"),
-            func.count(Booking.id).label("bookings"),
-            func.sum(Booking.total_amount).label("daily_revenue")
-        )
-        .where(
-            Booking.status == BookingStatus.CONFIRMED,
-            func.date(Booking.created_at) >= start_date,
-            func.date(Booking.created_at) <= end_date
+    # Aggregate confirmed bookings per day with actual amounts paid (including dynamic pricing)
+    # and left join onto the full date range. The range predicate on created_at (rather than
+    # on date(created_at)) lets ix_bookings_confirmed_created_at serve the scan. The bounds are
+    # bound as dates and widened to timestamptz on the server, so day boundaries fall at
+    # midnight in the session time zone that date(created_at) groups by (a timestamptz bind
+    # would be converted by the driver in the app process's local time zone instead).
+    stmt = text("""
+        WITH agg AS (
+            SELECT date(created_at) AS day,
+                   count(id) AS bookings,
+                   sum(total_amount) AS revenue
+            FROM bookings
+            WHERE status = 'CONFIRMED'
+              AND created_at >= CAST(CAST(:start_date AS date) AS timestamptz)
+              AND created_at < CAST(CAST(:end_date AS date) + 1 AS timestamptz)
+            GROUP BY date(created_at)
         )
-        .group_by(func.date(Booking.created_at))
-        .order_by(func.date(Booking.created_at))
-    )
-    result = await db.execute(stmt)
-    rows = {r.day: (r.bookings, float(r.daily_revenue or 0.0)) for r in result.all()}
-
-    # Fill gaps
-    output = []
-    for i in range(days):
-        d = start_date + timedelta(days=i)
-        b, rev = rows.get(d, (0, 0.0))
-        output.append({"date": d.isoformat(), "bookings": b, "revenue": rev})
-    return output
\ No newline at end of file
+        SELECT d::date AS day,
+               COALESCE(agg.bookings, 0) AS bookings,
+               COALESCE(agg.revenue, 0) AS revenue
+        FROM generate_series(CAST(:start_date AS date), CAST(:end_date AS date), interval '1 day') AS d
+        LEFT JOIN agg ON agg.day = d::date
+        ORDER BY d
+    """)
+    async with engine.connect() as conn:
+        result = await conn.stream(stmt, {"start_date": start_date, "end_date": end_date})
+        async for r in result:
+            yield {"date": r.day.isoformat(), "bookings": r.bookings, "revenue": float(r.revenue)}
@@ -1,9 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, lambda_stmt
+from sqlalchemy.orm import load_only
 from typing import Optional, List
 from uuid import UUID
 from ..models.models import User, UserRole
-from ..core.security import get_password_hash, verify_password
+from ..core.security import get_password_hash, verify_password_cached
 
 
 async def create_user(db: AsyncSession, email: str, password: str, role: UserRole = UserRole.USER) -> User:
@@ -16,26 +17,36 @@ async def create_user(db: AsyncSession, email: str, password: str, role: UserRol
     )
     db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
     return db_user
 
 
+def _select_user_by_email(email: str):
+    """Case-insensitive user-by-email SELECT, served by ix_users_email_lower"""
+    email_lower = email.lower()
+    # lambda_stmt caches the constructed statement; only the bound email varies
+    return lambda_stmt(lambda: select(User).where(func.lower(User.email) == email_lower))
+
+
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
-    """Get user by email"""
-    result = await db.execute(select(User).where(User.email == email))
+    """Get user by email (case-insensitive)"""
+    result = await db.execute(_select_user_by_email(email))
     return result.scalar_one_or_none()
 
 
 async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     """Get user by ID"""
-    result = await db.execute(select(User).where(User.id == user_id))
+    result = await db.execute(lambda_stmt(lambda: select(User).where(User.id == user_id)))
     return result.scalar_one_or_none()
 
 
 async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
     """Authenticate user with email and password"""
-    user = await get_user_by_email(db, email)
-    if not user or not verify_password(password, user.hashed_password):
+    # Login only needs the credentials and token claims; skip the other columns
+    stmt = _select_user_by_email(email)
+    stmt += lambda s: s.options(load_only(User.id, User.email, User.hashed_password, User.role))
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
+    if not user or not verify_password_cached(email, password, user.hashed_password):
         return None
     return user
 
@@ -44,3 +55,8 @@ async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[U
     """Get list of users"""
     result = await db.execute(select(User).offset(skip).limit(limit))
     return result.scalars().all()
+
+
+async def count_users(db: AsyncSession) -> int:
+    """Count all users"""
+    return await db.scalar(select(func.count()).select_from(User)) or 0
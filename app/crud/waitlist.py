@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional, List
 from uuid import UUID
 from ..models.models import WaitlistEntry
@@ -7,29 +8,35 @@ from ..models.models import WaitlistEntry
 
 async def join_waitlist(db: AsyncSession, user_id: UUID, event_id: UUID) -> WaitlistEntry:
     """Add user to event waitlist"""
-    # Check if user is already on waitlist
-    existing = await db.execute(
-        select(WaitlistEntry).where(
-            and_(WaitlistEntry.user_id == user_id, WaitlistEntry.event_id == event_id)
-        )
+    # Insert unless the user is already on the waitlist (uq_user_event_waitlist);
+    # a single statement, so concurrent joins can't both pass a check
+    stmt = (
+        pg_insert(WaitlistEntry)
+        .values(user_id=user_id, event_id=event_id)
+        .on_conflict_do_nothing(index_elements=["user_id", "event_id"])
+        .returning(WaitlistEntry)
     )
-    if existing.scalar_one_or_none():
+    waitlist_entry = (await db.scalars(stmt)).one_or_none()
+    if waitlist_entry is None:
         raise ValueError("User already on waitlist for this event")
     
-    waitlist_entry = WaitlistEntry(user_id=user_id, event_id=event_id)
-    db.add(waitlist_entry)
     await db.commit()
-    await db.refresh(waitlist_entry)
     return waitlist_entry
 
 
 async def get_next_waitlist_user(db: AsyncSession, event_id: UUID) -> Optional[WaitlistEntry]:
-    """Get the next user on the waitlist for an event"""
+    """
+    Get and lock the next user on the waitlist for an event.
+    Entries already locked by another consumer are skipped, so concurrent workers
+    never get the same entry. The lock lasts until the caller's transaction ends,
+    so promote/remove the entry before committing.
+    """
     result = await db.execute(
         select(WaitlistEntry)
         .where(WaitlistEntry.event_id == event_id)
         .order_by(WaitlistEntry.joined_at)
         .limit(1)
+        .with_for_update(skip_locked=True)
     )
     return result.scalar_one_or_none()
 
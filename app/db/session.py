@@ -1,12 +1,28 @@
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 from ..core.config import settings
 
+# Per-connection prepared statement caches (asyncpg driver only)
+_connect_args = {}
+if settings.database_url.startswith("postgresql+asyncpg"):
+    _connect_args = {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.environment == "development",
-    future=True
+    future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    pool_timeout=settings.db_pool_timeout,
+    connect_args=_connect_args
 )
 
 # Create async session factory
@@ -17,13 +33,31 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 # Create base class for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 
 async def get_db():
-    """Dependency to get database session"""
+    """
+    Dependency to get database session.
+    Transactions are committed by the service/CRUD layer, which also runs
+    post-commit side effects (cache invalidation, Celery tasks); the session
+    is closed, and any uncommitted work rolled back, on exit.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def run_in_session(func, *args, **kwargs):
+    """Run a CRUD coroutine on its own session so it can be awaited concurrently"""
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        return await func(session, *args, **kwargs)
+
+
+async def warm_up_pool(size: int = settings.db_pool_size) -> None:
+    """Open `size` pooled connections up front so early requests don't pay connect cost"""
+    async def _checkout():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    await asyncio.gather(*(_checkout() for _ in range(size)))
@@ -1,20 +1,30 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
+import time
+import orjson
 from contextlib import asynccontextmanager
 from .api import auth, events, bookings, waitlist, admin, monitoring
-from .db.session import engine
+from .db.session import engine, warm_up_pool
 from .models.models import Base
 from .core.config import settings
-from .core.exceptions import EventlyBaseException, to_http_exception
+from .core.exceptions import EventlyBaseException, CachedHTTPException, to_http_exception
 from .core.rate_limiting import RateLimitMiddleware
-from .core.monitoring import performance_middleware
+from .core.monitoring import performance_middleware, request_id_var
+from .core.logging_config import configure_logging
+from .services.cache import redis_client
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging (formatting and I/O happen off the event loop)
+configure_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Business exceptions are expected under load (sold-out seats, rate limits);
+# log each exception type at most once per interval
+BUSINESS_EXC_LOG_INTERVAL = 1.0
+_business_exc_logged_at = {}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -22,15 +32,22 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Evently API...")
     
-    # Create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Schema is managed by create_tables.py outside of development, so
+    # production workers don't pay for the catalog round-trips on boot
+    if settings.environment == "development":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    
+    # Pre-open pooled DB connections
+    await warm_up_pool()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Evently API...")
     await engine.dispose()
+    if redis_client is not None:
+        await redis_client.close()
 
 
 # Create FastAPI application
@@ -38,16 +55,8 @@ app = FastAPI(
     title="Evently API",
     description="A production-ready event ticketing platform with seat-level booking",
     version="1.0.0",
-    lifespan=lifespan
-)
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Rate limiting middleware
@@ -56,14 +65,39 @@ app.add_middleware(RateLimitMiddleware)
 # Performance monitoring middleware
 app.middleware("http")(performance_middleware)
 
+# Compress large JSON bodies (seat maps, heatmaps, event lists); small
+# responses and preflights stay below minimum_size and pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# CORS middleware; added last so it is outermost and answers preflights
+# before rate limiting and monitoring run
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins,
+    allow_credentials=True,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+)
+
 
 # Enhanced exception handlers
 @app.exception_handler(EventlyBaseException)
 async def evently_exception_handler(request: Request, exc: EventlyBaseException):
     """Handle custom Evently exceptions"""
-    logger.warning(f"Business logic exception: {exc.message} - Details: {exc.details}")
+    now = time.monotonic()
+    exc_type = type(exc)
+    if now - _business_exc_logged_at.get(exc_type, 0.0) >= BUSINESS_EXC_LOG_INTERVAL:
+        _business_exc_logged_at[exc_type] = now
+        logger.warning("Business logic exception: %s - Details: %s", exc.message, exc.details)
     http_exc = to_http_exception(exc)
-    return JSONResponse(
+    if isinstance(http_exc, CachedHTTPException):
+        return Response(
+            content=http_exc.body,
+            status_code=http_exc.status_code,
+            headers=http_exc.headers,
+            media_type="application/json"
+        )
+    return ORJSONResponse(
         status_code=http_exc.status_code,
         content=http_exc.detail,
         headers=getattr(http_exc, 'headers', {})
@@ -74,26 +108,36 @@ async def evently_exception_handler(request: Request, exc: EventlyBaseException)
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions"""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "message": "An internal server error occurred",
             "details": {},
-            "request_id": getattr(request.state, 'request_id', 'unknown')
+            "request_id": request_id_var.get()
         }
     )
 
 
+# Static bodies for the health and root endpoints, serialized once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "environment": settings.environment,
+    "version": "1.0.0"
+})
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to Evently API",
+    "version": "1.0.0",
+    "docs_url": "/docs",
+    "redoc_url": "/redoc"
+})
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "environment": settings.environment,
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Include API routers
@@ -109,9 +153,4 @@ app.include_router(monitoring.router, prefix="/monitoring", tags=["Monitoring"])
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "message": "Welcome to Evently API",
-        "version": "1.0.0",
-        "docs_url": "/docs",
-        "redoc_url": "/redoc"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -1,15 +1,38 @@
 from sqlalchemy import (
     Column, Integer, String, DateTime, Text, ForeignKey, Enum,
-    UniqueConstraint, Index, Float
+    UniqueConstraint, Index, Float, Numeric, Computed
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from enum import Enum as PyEnum
+import os
+import time
 import uuid
 from ..db.session import Base
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp followed by
+    random bits. Consecutive inserts land on neighbouring btree pages instead of
+    random ones. Used for high-volume rows; users/events keep opaque uuid4 ids.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+# Money is stored as exact NUMERIC so SUM()s over bookings don't accumulate float
+# error; asdecimal=False keeps the Python side as float for the pricing code.
+Money = Numeric(10, 2, asdecimal=False)
+PriceMultiplier = Numeric(6, 4, asdecimal=False)
+
+
+# Enum columns are stored as VARCHAR(16) with a CHECK constraint rather than
+# Postgres ENUM types, so adding a member needs no ALTER TYPE. Rows hold the
+# member NAME ('AVAILABLE', 'CONFIRMED'); raw SQL compares against names.
 class UserRole(PyEnum):
     USER = "user"
     ADMIN = "admin"
@@ -30,11 +53,23 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
+    email = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
-    role = Column(Enum(UserRole), default=UserRole.USER)
+    role = Column(
+        Enum(UserRole, native_enum=False, length=16, create_constraint=True, name="ck_user_role"),
+        default=UserRole.USER
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    # Constraints
+    __table_args__ = (
+        # Case-insensitive email lookups (login, registration checks); also the
+        # only uniqueness guarantee on email
+        Index('ix_users_email_lower', func.lower(email), unique=True),
+    )
+    # Fetch server defaults (created_at) via RETURNING on INSERT
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Relationships
     bookings = relationship("Booking", back_populates="user")
     waitlist_entries = relationship("WaitlistEntry", back_populates="user")
@@ -51,10 +86,13 @@ class Event(Base):
     start_time = Column(DateTime(timezone=True), nullable=False)
     end_time = Column(DateTime(timezone=True), nullable=False)
     total_capacity = Column(Integer, nullable=False)
-    base_price = Column(Float, nullable=False, default=50.0)  # Base price per seat
+    base_price = Column(Money, nullable=False, default=50.0)  # Base price per seat
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    # Fetch server defaults (created_at) via RETURNING on INSERT
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Relationships
     creator = relationship("User", back_populates="created_events")
     seats = relationship("Seat", back_populates="event", cascade="all, delete-orphan")
@@ -66,15 +104,24 @@ class Event(Base):
 class Seat(Base):
     __tablename__ = "seats"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
     seat_identifier = Column(String, nullable=False)  # e.g., 'A1', 'SEC-B-R5-S12'
-    status = Column(Enum(SeatStatus), default=SeatStatus.AVAILABLE, index=True)
+    status = Column(
+        Enum(SeatStatus, native_enum=False, length=16, create_constraint=True, name="ck_seat_status"),
+        default=SeatStatus.AVAILABLE
+    )
     
     # Constraints
     __table_args__ = (
+        # Also serves all-seats-for-event scans via its event_id prefix
         UniqueConstraint('event_id', 'seat_identifier', name='uq_event_seat'),
-        Index('ix_seats_event_status', 'event_id', 'status'),
+        # Partial index for available-seat lookups/counts; the only status index,
+        # so booked/locked rows carry no index entries
+        Index(
+            'ix_seats_event_available', 'event_id',
+            postgresql_where=text("status = 'AVAILABLE'")
+        ),
     )
     
     # Relationships
@@ -85,19 +132,35 @@ class Seat(Base):
 class Booking(Base):
     __tablename__ = "bookings"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
-    status = Column(Enum(BookingStatus), default=BookingStatus.CONFIRMED)
+    status = Column(
+        Enum(BookingStatus, native_enum=False, length=16, create_constraint=True, name="ck_booking_status"),
+        default=BookingStatus.CONFIRMED
+    )
     
     # Pricing information
-    base_price_per_ticket = Column(Float, nullable=False)  # Base price at time of booking
-    final_price_per_ticket = Column(Float, nullable=False)  # Final price paid per ticket
-    price_multiplier = Column(Float, nullable=False, default=1.0)  # Multiplier applied
-    total_amount = Column(Float, nullable=False)  # Total amount paid for all tickets
+    base_price_per_ticket = Column(Money, nullable=False)  # Base price at time of booking
+    final_price_per_ticket = Column(Money, nullable=False)  # Final price paid per ticket
+    price_multiplier = Column(PriceMultiplier, nullable=False, default=1.0)  # Multiplier applied
+    total_amount = Column(Money, nullable=False)  # Total amount paid for all tickets
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
+    # Constraints
+    __table_args__ = (
+        # Covers confirmed-booking aggregates grouped by event (popular events)
+        Index('ix_bookings_status_event', 'status', 'event_id'),
+        # Date-range scans over confirmed bookings (daily trends)
+        Index(
+            'ix_bookings_confirmed_created_at', 'created_at',
+            postgresql_where=text("status = 'CONFIRMED'")
+        ),
+    )
+    # Fetch server defaults (created_at) via RETURNING on INSERT
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Relationships
     user = relationship("User", back_populates="bookings")
     event = relationship("Event", back_populates="bookings")
@@ -107,7 +170,7 @@ class Booking(Base):
 class Ticket(Base):
     __tablename__ = "tickets"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     booking_id = Column(UUID(as_uuid=True), ForeignKey("bookings.id"), nullable=False)
     seat_id = Column(UUID(as_uuid=True), ForeignKey("seats.id"), nullable=False)
     qr_code_data = Column(String, nullable=False)
@@ -120,7 +183,7 @@ class Ticket(Base):
 class WaitlistEntry(Base):
     __tablename__ = "waitlist_entries"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -135,10 +198,18 @@ class WaitlistEntry(Base):
     event = relationship("Event", back_populates="waitlist_entries")
 
 
+# Heatmap intensity: popularity plus a small boost for group bookings, capped at
+# 100. Stored as a generated column so Postgres keeps it in step with the scores.
+HEAT_INTENSITY_SQL = (
+    "round(LEAST(100.0, popularity_score + GREATEST(group_booking_score, 0) * 0.1)::numeric, 1)"
+    "::double precision"
+)
+
+
 class SeatAnalytics(Base):
     __tablename__ = "seat_analytics"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
     seat_id = Column(UUID(as_uuid=True), ForeignKey("seats.id"), nullable=False)
     
@@ -146,6 +217,7 @@ class SeatAnalytics(Base):
     booking_speed_score = Column(Float, default=0.0)  # How fast this seat was booked (0-100)
     group_booking_score = Column(Float, default=0.0)  # Part of larger group bookings (0-100)
     popularity_score = Column(Float, default=0.0)     # Overall popularity metric (0-100)
+    heat_intensity = Column(Float, Computed(HEAT_INTENSITY_SQL, persisted=True))  # Derived (0-100)
     
     # Metadata
     last_updated = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, TypeAdapter, StringConstraints, Field, AfterValidator
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Annotated
 from enum import Enum
 from uuid import UUID
 
@@ -21,6 +21,11 @@ class BookingStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Shape-only email check for logins: the address is just a lookup key there, so
+# full EmailStr parsing is kept for registration only
+LoginEmail = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)]
+
+
 # User schemas
 class UserCreate(BaseModel):
     email: EmailStr
@@ -28,7 +33,7 @@ class UserCreate(BaseModel):
 
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: LoginEmail
     password: str
 
 
@@ -108,9 +113,20 @@ class SeatMapResponse(BaseModel):
 
 
 # Booking schemas
+MAX_SEATS_PER_BOOKING = 20
+
+# Bounded and de-duplicated (order kept) at validation time, which also caps
+# how many seat rows one booking transaction can lock
+SeatIdentifierList = Annotated[
+    List[str],
+    Field(min_length=1, max_length=MAX_SEATS_PER_BOOKING),
+    AfterValidator(lambda v: list(dict.fromkeys(v)))
+]
+
+
 class BookingCreate(BaseModel):
     event_id: UUID
-    seat_identifiers: List[str]
+    seat_identifiers: SeatIdentifierList
 
 
 # Ticket schemas
@@ -244,6 +260,22 @@ class BookingCostEstimate(BaseModel):
 
 class BookingCreateWithPricing(BaseModel):
     event_id: UUID
-    seat_identifiers: List[str]
+    seat_identifiers: SeatIdentifierList
     # Optional field to acknowledge the current price
     acknowledged_price_per_ticket: Optional[float] = None
+
+
+def from_orm_fast(cls, obj, **overrides):
+    """
+    Build a response model from a trusted ORM row without running validation.
+    Use overrides for fields that need conversion (nested models, enums).
+    """
+    values = {name: getattr(obj, name) for name in cls.model_fields if name not in overrides}
+    values.update(overrides)
+    return cls.model_construct(**values)
+
+
+# List adapters: validate ORM rows and serialize to JSON in a single pydantic-core call
+EventListAdapter = TypeAdapter(List[EventResponse])
+BookingListAdapter = TypeAdapter(List[BookingResponse])
+WaitlistListAdapter = TypeAdapter(List[WaitlistResponse])
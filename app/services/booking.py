@@ -1,9 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
 from typing import List, Optional
 from uuid import UUID
 from ..crud import booking as booking_crud, event as event_crud
 from ..models.models import Booking, Seat, SeatStatus, Event
-from .cache import CacheService, get_event_seats_cache_key
+from .cache import CacheService, get_event_seats_cache_key, invalidate_events_list_cache
 from .pricing import DynamicPricingService
 import logging
 
@@ -25,17 +26,19 @@ class BookingService:
         This method now handles its own transaction.
         """
         try:
-            # Verify event exists first
-            event = await event_crud.get_event_by_id(db, event_id)
-            if not event:
-                raise ValueError("Event not found")
+            # Claim the seats and read the event's pricing inputs in one statement;
+            # raises ValueError if the event or any seat is missing or taken
+            (base_price, start_time), claimed_seats = await booking_crud.get_event_and_lock_seats(
+                db, event_id, seat_identifiers
+            )
             
             # Calculate dynamic pricing
             current_price = DynamicPricingService.calculate_current_price(
-                event.base_price, event.start_time
+                base_price, start_time
             )
             
-            # Check if price was acknowledged (optional safety check)
+            # Check if price was acknowledged (optional safety check); the
+            # rollback below releases the claimed seats
             if acknowledged_price_per_ticket is not None:
                 price_diff = abs(current_price - acknowledged_price_per_ticket)
                 if price_diff > 0.01:  # Allow small rounding differences
@@ -45,15 +48,15 @@ class BookingService:
                     )
             
             # Calculate pricing details
-            num_tickets = len(seat_identifiers)
+            num_tickets = len(claimed_seats)
             pricing_details = DynamicPricingService.calculate_total_booking_cost(
-                event.base_price, event.start_time, num_tickets
+                base_price, start_time, num_tickets
             )
             
             # Create booking with pricing information
             booking = await booking_crud.create_booking_with_seats(
-                db, user_id, event_id, seat_identifiers,
-                base_price_per_ticket=event.base_price,
+                db, user_id, event_id, claimed_seats,
+                base_price_per_ticket=base_price,
                 final_price_per_ticket=current_price,
                 price_multiplier=pricing_details["price_multiplier"],
                 total_amount=pricing_details["total_cost"]
@@ -63,7 +66,7 @@ class BookingService:
             await db.commit()
             
             # Invalidate seat cache after successful commit
-            CacheService.delete(get_event_seats_cache_key(event_id))
+            await CacheService.delete(get_event_seats_cache_key(event_id))
             
             # Send booking confirmation email asynchronously
             try:
@@ -93,7 +96,7 @@ class BookingService:
         if booking:
             logger.info("Booking %s cancelled successfully", booking_id)
             # Invalidate seat cache
-            CacheService.delete(get_event_seats_cache_key(booking.event_id))
+            await CacheService.delete(get_event_seats_cache_key(booking.event_id))
             
             # Send cancellation email asynchronously
             try:
@@ -121,8 +124,9 @@ class EventService:
 
     @staticmethod
     def generate_default_seat_layout(total_capacity: int) -> List[str]:
-        # Simple linear layout A01-01 ... A01-NN
-        return [f"A01-{i:02d}" for i in range(1, total_capacity + 1)]
+        # Simple linear layout A01-01 ... A01-NN; map() over the bound %-format
+        # keeps the per-seat loop in C
+        return list(map("A01-%02d".__mod__, range(1, total_capacity + 1)))
 
     @staticmethod
     async def create_event_with_seats(
@@ -156,23 +160,21 @@ class EventService:
             db.add(event)
             await db.flush()  # Get event.id
 
-            # Seat layout
+            # Seat layout; the generated default is unique by construction,
+            # provided identifiers are de-duplicated (defensive), keeping order
             if not seat_layout:
-                seat_layout = EventService.generate_default_seat_layout(total_capacity)
-
-            # De-duplicate provided identifiers (defensive)
-            unique = []
-            seen = set()
-            for sid in seat_layout:
-                if sid not in seen:
-                    seen.add(sid)
-                    unique.append(sid)
+                unique = EventService.generate_default_seat_layout(total_capacity)
+            else:
+                unique = list(dict.fromkeys(seat_layout))
 
-            seats = [
-                Seat(event_id=event.id, seat_identifier=sid, status=SeatStatus.AVAILABLE)
-                for sid in unique
-            ]
-            db.add_all(seats)
+            # Bulk INSERT (batched by insertmanyvalues); no ORM objects needed
+            await db.execute(
+                insert(Seat),
+                [
+                    {"event_id": event.id, "seat_identifier": sid, "status": SeatStatus.AVAILABLE}
+                    for sid in unique
+                ]
+            )
 
             # Commit (single transaction)
             await db.commit()
@@ -181,7 +183,6 @@ class EventService:
             await db.rollback()
             raise
 
-        # Invalidate caches & refresh
-        CacheService.delete_pattern("events:list:*")
-        await db.refresh(event)
+        # Invalidate caches (created_at was already returned by the INSERT)
+        await invalidate_events_list_cache()
         return event
\ No newline at end of file
@@ -1,76 +1,243 @@
 import redis
-import json
-from typing import Optional, Any
+import redis.asyncio
+import orjson
+import secrets
+import time
+from typing import Optional, Any, List
 from uuid import UUID
 from ..core.config import settings
 
-# Redis client with error handling
+# Probe Redis once at import with a short-lived sync connection; request paths
+# only ever use the async client below
 try:
-    redis_client = redis.from_url(settings.redis_url, decode_responses=True)
-    # Test connection
-    redis_client.ping()
+    _probe = redis.from_url(settings.redis_url)
+    _probe.ping()
+    _probe.close()
     REDIS_AVAILABLE = True
 except Exception:
-    redis_client = None
     REDIS_AVAILABLE = False
     print("⚠️  Redis not available - caching disabled")
 
+# HINCRBY and EXPIRE in one round-trip; the TTL is only set when the hash has none,
+# so all counters in a hash share one window
+_HINCR_WITH_EXPIRY_LUA = """
+local count = redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+if redis.call('TTL', KEYS[1]) < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return count
+"""
+
+# Compare-and-delete: release a lock only while it still holds our token, so a
+# holder whose TTL lapsed can't delete a lock another caller has since taken
+_RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Async client shared by every request path (cache reads/writes, rate limiting).
+# The blocking pool makes callers wait for a free connection instead of erroring.
+# Responses stay as bytes: cached payloads are JSON bytes on both ends.
+redis_client = redis.asyncio.Redis(
+    connection_pool=redis.asyncio.BlockingConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections
+    )
+) if REDIS_AVAILABLE else None
+_hincr_with_expiry_script = redis_client.register_script(_HINCR_WITH_EXPIRY_LUA) if REDIS_AVAILABLE else None
+_release_lock_script = redis_client.register_script(_RELEASE_LOCK_LUA) if REDIS_AVAILABLE else None
+
+# Keys fetched per SCAN call and unlinked per UNLINK when deleting by pattern
+SCAN_BATCH_SIZE = 500
+
 
 class CacheService:
     """Service for caching operations using Redis"""
     
     @staticmethod
-    def get(key: str) -> Optional[Any]:
+    async def get(key: str) -> Optional[Any]:
         """Get value from cache"""
         if not REDIS_AVAILABLE:
             return None
         try:
-            value = redis_client.get(key)
+            value = await redis_client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception:
             return None
     
     @staticmethod
-    def set(key: str, value: Any, expire: int = 3600) -> bool:
+    async def set(key: str, value: Any, expire: int = 3600) -> bool:
         """Set value in cache with expiration"""
         if not REDIS_AVAILABLE:
             return False
         try:
-            redis_client.setex(key, expire, json.dumps(value, default=str))
+            await redis_client.setex(key, expire, orjson.dumps(value, default=str))
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    async def get_raw(key: str) -> Optional[bytes]:
+        """Get a pre-serialized JSON payload from cache"""
+        if not REDIS_AVAILABLE:
+            return None
+        try:
+            return await redis_client.get(key)
+        except Exception:
+            return None
+    
+    @staticmethod
+    async def mget_raw(*keys: str) -> List[Optional[bytes]]:
+        """Get several pre-serialized payloads in one round-trip (None for misses)"""
+        if not REDIS_AVAILABLE:
+            return [None] * len(keys)
+        try:
+            return await redis_client.mget(keys)
+        except Exception:
+            return [None] * len(keys)
+    
+    @staticmethod
+    async def set_raw(key: str, value: bytes, expire: int = 3600) -> bool:
+        """Set a pre-serialized JSON payload in cache with expiration"""
+        if not REDIS_AVAILABLE:
+            return False
+        try:
+            await redis_client.setex(key, expire, value)
             return True
         except Exception:
             return False
     
     @staticmethod
-    def delete(key: str) -> bool:
+    async def hincr_with_expiry(key: str, field: str, expire: int) -> Optional[int]:
+        """Atomically increment a hash field counter, starting the hash TTL if unset"""
+        if not REDIS_AVAILABLE:
+            return None
+        try:
+            return int(await _hincr_with_expiry_script(keys=[key], args=[field, expire]))
+        except Exception:
+            return None
+    
+    @staticmethod
+    async def acquire_lock(key: str, expire: int) -> Optional[str]:
+        """
+        Try to take a short-lived lock with SET NX EX. Returns the owner token to
+        pass to release_lock, or None if the lock is held (fails open without Redis).
+        """
+        token = secrets.token_hex(16)
+        if not REDIS_AVAILABLE:
+            return token
+        try:
+            return token if await redis_client.set(key, token, nx=True, ex=expire) else None
+        except Exception:
+            return token
+    
+    @staticmethod
+    async def release_lock(key: str, token: str) -> bool:
+        """Release a lock taken by acquire_lock, only if it still holds this token"""
+        if not REDIS_AVAILABLE:
+            return False
+        try:
+            return bool(await _release_lock_script(keys=[key], args=[token]))
+        except Exception:
+            return False
+    
+    @staticmethod
+    async def delete(key: str) -> bool:
         """Delete key from cache"""
         if not REDIS_AVAILABLE:
             return False
         try:
-            redis_client.delete(key)
+            await redis_client.delete(key)
             return True
         except Exception:
             return False
     
     @staticmethod
-    def delete_pattern(pattern: str) -> bool:
+    async def delete_pattern(pattern: str) -> bool:
         """Delete all keys matching pattern"""
         if not REDIS_AVAILABLE:
             return False
         try:
-            keys = redis_client.keys(pattern)
-            if keys:
-                redis_client.delete(*keys)
+            # SCAN walks the keyspace in bounded batches instead of one blocking KEYS
+            batch = []
+            async for key in redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    await redis_client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                await redis_client.unlink(*batch)
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    async def delete_many(keys: Optional[List[str]] = None, patterns: Optional[List[str]] = None) -> bool:
+        """Delete exact keys and all keys matching patterns with a single UNLINK"""
+        if not REDIS_AVAILABLE:
+            return False
+        try:
+            to_delete = list(keys or [])
+            for pattern in patterns or []:
+                to_delete.extend([key async for key in redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE)])
+            if to_delete:
+                await redis_client.unlink(*to_delete)
             return True
         except Exception:
             return False
 
 
+# Event list cache versioning: bumping the version orphans every cached page at once;
+# stale pages expire on their own TTL. The version is memoized in-process briefly.
+EVENTS_LIST_VERSION_KEY = "events:list:version"
+EVENTS_LIST_VERSION_TTL = 1.0
+_events_list_version = {"value": "0", "fetched_at": 0.0}
+
+
+async def get_events_list_version() -> str:
+    """Get the current event list cache version"""
+    now = time.monotonic()
+    if now - _events_list_version["fetched_at"] < EVENTS_LIST_VERSION_TTL:
+        return _events_list_version["value"]
+    
+    version = "0"
+    if REDIS_AVAILABLE:
+        try:
+            version = (await redis_client.get(EVENTS_LIST_VERSION_KEY) or b"0").decode()
+        except Exception:
+            pass
+    _events_list_version["value"] = version
+    _events_list_version["fetched_at"] = now
+    return version
+
+
+async def invalidate_events_list_cache(*also_delete: str) -> bool:
+    """
+    Invalidate all cached event list pages with a single INCR; any extra keys
+    (e.g. the changed event's own entries) are unlinked in the same round-trip.
+    """
+    if not REDIS_AVAILABLE:
+        return False
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.incr(EVENTS_LIST_VERSION_KEY)
+            if also_delete:
+                pipe.unlink(*also_delete)
+            results = await pipe.execute()
+        _events_list_version["value"] = str(results[0])
+        _events_list_version["fetched_at"] = time.monotonic()
+        return True
+    except Exception:
+        return False
+
+
 # Cache key generators
-def get_events_cache_key(skip: int = 0, limit: int = 100) -> str:
-    return f"events:list:{skip}:{limit}"
+async def get_events_cache_key(skip: int = 0, limit: int = 100) -> str:
+    return f"events:list:v{await get_events_list_version()}:{skip}:{limit}"
 
 
 def get_event_cache_key(event_id: UUID) -> str:
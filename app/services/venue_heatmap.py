@@ -3,6 +3,7 @@ from typing import List, Dict, Any, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, text, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 from ..models.models import (
     Event, Seat, SeatStatus, Booking, BookingStatus, 
@@ -35,7 +36,7 @@ class VenueHeatmapService:
         
         # Try cache first (unless force refresh)
         if not force_refresh:
-            cached_heatmap = CacheService.get(cache_key)
+            cached_heatmap = await CacheService.get(cache_key)
             if cached_heatmap:
                 return VenueHeatmapResponse(**cached_heatmap)
         
@@ -50,9 +51,18 @@ class VenueHeatmapService:
         # Update analytics data before generating heatmap
         await VenueHeatmapService._update_seat_analytics(db, event_id)
         
-        # Get seats with analytics data
+        # Get seats with their analytics scores; heat_intensity is computed by
+        # Postgres, so rows come back ready to serialize
         seats_query = (
-            select(Seat, SeatAnalytics)
+            select(
+                Seat.id,
+                Seat.seat_identifier,
+                Seat.status,
+                func.coalesce(SeatAnalytics.booking_speed_score, 0.0),
+                func.coalesce(SeatAnalytics.group_booking_score, 0.0),
+                func.coalesce(SeatAnalytics.popularity_score, 0.0),
+                func.coalesce(SeatAnalytics.heat_intensity, 0.0)
+            )
             .outerjoin(SeatAnalytics, and_(
                 SeatAnalytics.seat_id == Seat.id,
                 SeatAnalytics.event_id == event_id
@@ -62,38 +72,30 @@ class VenueHeatmapService:
         )
         
         seats_result = await db.execute(seats_query)
-        seats_data = seats_result.fetchall()
+        seats_data = seats_result.all()
         
         # Calculate capacity stats
         total_seats = len(seats_data)
-        booked_seats = sum(1 for seat_row in seats_data if seat_row[0].status == SeatStatus.BOOKED)
+        booked_seats = sum(1 for seat_row in seats_data if seat_row[2] == SeatStatus.BOOKED)
         capacity_percentage = (booked_seats / total_seats) if total_seats > 0 else 0.0
         
-        # Generate heatmap data for each seat
-        heatmap_seats = []
-        for seat_row in seats_data:
-            seat, analytics = seat_row[0], seat_row[1]
-            
-            # Use analytics data if available, otherwise defaults
-            booking_speed_score = analytics.booking_speed_score if analytics else 0.0
-            group_booking_score = analytics.group_booking_score if analytics else 0.0
-            popularity_score = analytics.popularity_score if analytics else 0.0
-            
-            # Calculate overall heat intensity (weighted average)
-            heat_intensity = VenueHeatmapService._calculate_heat_intensity(
-                booking_speed_score, group_booking_score, popularity_score
-            )
-            
-            heatmap_seats.append(SeatHeatmapData(
-                seat_id=seat.id,
-                seat_identifier=seat.seat_identifier,
+        # Server-computed values; build the models without re-validation
+        heatmap_seats = [
+            SeatHeatmapData.model_construct(
+                seat_id=seat_id,
+                seat_identifier=seat_identifier,
                 booking_speed_score=booking_speed_score,
                 group_booking_score=group_booking_score,
                 popularity_score=popularity_score,
                 heat_intensity=heat_intensity
-            ))
+            )
+            for (
+                seat_id, seat_identifier, _, booking_speed_score,
+                group_booking_score, popularity_score, heat_intensity
+            ) in seats_data
+        ]
         
-        heatmap_response = VenueHeatmapResponse(
+        heatmap_response = VenueHeatmapResponse.model_construct(
             event_id=event_id,
             event_name=event.name,
             total_seats=total_seats,
@@ -104,7 +106,7 @@ class VenueHeatmapService:
         )
         
         # Cache for 15 minutes (analytics don't change too frequently)
-        CacheService.set(cache_key, heatmap_response.model_dump(), expire=900)
+        await CacheService.set(cache_key, heatmap_response.model_dump(), expire=900)
         
         return heatmap_response
     
@@ -127,6 +129,7 @@ class VenueHeatmapService:
         seats_result = await db.execute(seats_query)
         seats = seats_result.scalars().all()
         
+        analytics_rows = []
         for seat in seats:
             # Calculate analytics scores for this seat
             booking_speed_score = await VenueHeatmapService._calculate_booking_speed_score(
@@ -141,11 +144,16 @@ class VenueHeatmapService:
                 booking_speed_score, group_booking_score
             )
             
-            # Upsert analytics record
-            await VenueHeatmapService._upsert_seat_analytics(
-                db, event_id, seat.id, booking_speed_score, 
-                group_booking_score, popularity_score
-            )
+            analytics_rows.append({
+                "event_id": event_id,
+                "seat_id": seat.id,
+                "booking_speed_score": booking_speed_score,
+                "group_booking_score": group_booking_score,
+                "popularity_score": popularity_score,
+            })
+        
+        # Upsert all analytics records in one statement
+        await VenueHeatmapService._upsert_seat_analytics(db, analytics_rows)
     
     @staticmethod
     async def _calculate_booking_speed_score(
@@ -250,59 +258,29 @@ class VenueHeatmapService:
         popularity = (booking_speed_score * 0.7) + (group_booking_score * 0.3)
         return round(popularity, 1)
     
-    @staticmethod
-    def _calculate_heat_intensity(
-        booking_speed_score: float,
-        group_booking_score: float, 
-        popularity_score: float
-    ) -> float:
-        """Calculate visual heat intensity for the seat (0-100)"""
-        # Use popularity score as primary heat indicator
-        # Add slight boost for group bookings to make them stand out
-        heat = popularity_score
-        if group_booking_score > 0:
-            heat = min(100.0, heat + (group_booking_score * 0.1))
-        
-        return round(heat, 1)
-    
     @staticmethod
     async def _upsert_seat_analytics(
         db: AsyncSession,
-        event_id: UUID,
-        seat_id: UUID,
-        booking_speed_score: float,
-        group_booking_score: float,
-        popularity_score: float
+        analytics_rows: List[Dict[str, Any]]
     ) -> None:
-        """Insert or update seat analytics record"""
-        
-        # Check if record exists
-        existing_query = select(SeatAnalytics).where(
-            and_(
-                SeatAnalytics.event_id == event_id,
-                SeatAnalytics.seat_id == seat_id
-            )
-        )
+        """Insert or update seat analytics records with a single bulk upsert"""
         
-        existing_result = await db.execute(existing_query)
-        existing_analytics = existing_result.scalar_one_or_none()
+        if not analytics_rows:
+            return
         
-        if existing_analytics:
-            # Update existing record
-            existing_analytics.booking_speed_score = booking_speed_score
-            existing_analytics.group_booking_score = group_booking_score
-            existing_analytics.popularity_score = popularity_score
-            existing_analytics.last_updated = datetime.utcnow()
-        else:
-            # Create new record
-            new_analytics = SeatAnalytics(
-                event_id=event_id,
-                seat_id=seat_id,
-                booking_speed_score=booking_speed_score,
-                group_booking_score=group_booking_score,
-                popularity_score=popularity_score
-            )
-            db.add(new_analytics)
+        # One INSERT ... ON CONFLICT (batched by insertmanyvalues) instead of a
+        # SELECT plus ORM insert/update per seat
+        stmt = pg_insert(SeatAnalytics)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_event_seat_analytics",
+            set_={
+                "booking_speed_score": stmt.excluded.booking_speed_score,
+                "group_booking_score": stmt.excluded.group_booking_score,
+                "popularity_score": stmt.excluded.popularity_score,
+                "last_updated": func.now(),
+            }
+        )
+        await db.execute(stmt, analytics_rows)
         
         # Note: Don't commit here - let the caller handle transaction
     
@@ -310,7 +288,7 @@ class VenueHeatmapService:
     async def invalidate_heatmap_cache(event_id: UUID) -> bool:
         """Invalidate heatmap cache for an event"""
         cache_key = VenueHeatmapService.get_heatmap_cache_key(event_id)
-        return CacheService.delete(cache_key)
+        return await CacheService.delete(cache_key)
     
     @staticmethod
     async def get_top_hottest_seats(
@@ -1,9 +1,9 @@
 from .celery_app import celery_app
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.orm import sessionmaker, selectinload, joinedload
 from uuid import UUID
 from ..core.config import settings
-from ..models.models import User, Event, Booking, WaitlistEntry
+from ..models.models import User, Event, Booking, Ticket, WaitlistEntry
 from ..services.email import EmailService
 import logging
 
@@ -79,8 +79,10 @@ def notify_all_waitlist_users(event_id):  # Can be UUID object or string
             else:
                 event_uuid = event_id  # Already a UUID object
             
-            # Get all waitlist users for this event, ordered by join time
-            waitlist_entries = db.query(WaitlistEntry).filter(
+            # Get all waitlist entries for this event with their users, ordered by join time
+            waitlist_entries = db.query(WaitlistEntry).options(
+                joinedload(WaitlistEntry.user)
+            ).filter(
                 WaitlistEntry.event_id == event_uuid
             ).order_by(WaitlistEntry.joined_at).all()
             
@@ -99,7 +101,7 @@ def notify_all_waitlist_users(event_id):  # Can be UUID object or string
             failed_notifications = 0
             
             for waitlist_entry in waitlist_entries:
-                user = db.query(User).filter(User.id == waitlist_entry.user_id).first()
+                user = waitlist_entry.user
                 
                 if not user:
                     logger.warning("User %s not found for waitlist entry", waitlist_entry.user_id)
@@ -138,7 +140,7 @@ def send_booking_confirmation_email(booking_id):  # Can be UUID object or string
     """
     try:
         with SyncSessionLocal() as db:
-            # Get booking with tickets loaded
+            # Get booking with tickets, their seats, user and event loaded
             # Handle both UUID objects and strings
             if isinstance(booking_id, str):
                 booking_uuid = UUID(booking_id)
@@ -146,16 +148,18 @@ def send_booking_confirmation_email(booking_id):  # Can be UUID object or string
                 booking_uuid = booking_id  # Already a UUID object
             
             booking = db.query(Booking).options(
-                selectinload(Booking.tickets)
+                selectinload(Booking.tickets).joinedload(Ticket.seat),
+                joinedload(Booking.user),
+                joinedload(Booking.event)
             ).filter(Booking.id == booking_uuid).first()
             
             if not booking:
                 logger.error("Booking %s not found for confirmation email", booking_id)
                 return f"Booking {booking_id} not found"
 
-            # Get user and event
-            user = db.query(User).filter(User.id == booking.user_id).first()
-            event = db.query(Event).filter(Event.id == booking.event_id).first()
+            # User and event were loaded with the booking
+            user = booking.user
+            event = booking.event
 
             if not user or not event:
                 logger.error("Missing user or event for booking confirmation email (user=%s event=%s)", user, event)
@@ -182,7 +186,7 @@ def send_booking_cancellation_email(booking_id):  # Can be UUID object or string
     """
     try:
         with SyncSessionLocal() as db:
-            # Get booking with tickets loaded (even if cancelled)
+            # Get booking with tickets, their seats, user and event loaded (even if cancelled)
             # Handle both UUID objects and strings
             if isinstance(booking_id, str):
                 booking_uuid = UUID(booking_id)
@@ -190,16 +194,18 @@ def send_booking_cancellation_email(booking_id):  # Can be UUID object or string
                 booking_uuid = booking_id  # Already a UUID object
             
             booking = db.query(Booking).options(
-                selectinload(Booking.tickets)
+                selectinload(Booking.tickets).joinedload(Ticket.seat),
+                joinedload(Booking.user),
+                joinedload(Booking.event)
             ).filter(Booking.id == booking_uuid).first()
             
             if not booking:
                 logger.error("Booking %s not found for cancellation email", booking_id)
                 return f"Booking {booking_id} not found"
 
-            # Get user and event
-            user = db.query(User).filter(User.id == booking.user_id).first()
-            event = db.query(Event).filter(Event.id == booking.event_id).first()
+            # User and event were loaded with the booking
+            user = booking.user
+            event = booking.event
 
             if not user or not event:
                 logger.error("Missing user or event for booking cancellation email (user=%s event=%s)", user, event)
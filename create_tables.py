@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Create the database schema ahead of application startup.
+
+The API only runs create_all on boot in development; every other environment
+runs this script once per deploy instead (see the docker-compose command).
+It creates missing tables from the model definitions and then applies the
+index migrations, so it is safe to re-run against an existing database.
+"""
+
+import asyncio
+import sys
+from app.db.session import engine
+from app.models.models import Base
+from migrate_indexes import create_indexes
+
+
+async def create_tables():
+    """Create all missing tables"""
+    async with engine.begin() as conn:
+        print("Creating database tables...")
+        await conn.run_sync(Base.metadata.create_all)
+    
+    print("✅ Tables created successfully!")
+
+
+async def main():
+    """Schema setup entrypoint"""
+    try:
+        await create_tables()
+        await create_indexes()
+    except Exception as e:
+        print(f"\n❌ Schema setup failed: {e}")
+        print("Please check your database connection and try again.")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
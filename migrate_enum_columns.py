@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert Postgres ENUM columns to VARCHAR + CHECK.
+
+Databases created before this change store these columns as native ENUM types:
+- users.role (userrole)
+- seats.status (seatstatus)
+- bookings.status (bookingstatus)
+
+Each column is converted to VARCHAR(16) holding the same member names, a CHECK
+constraint restricts it to the enum members, and the ENUM type is dropped.
+The partial indexes filtering on status are dropped first (their predicates are
+typed against the ENUM) and recreated afterwards from migrate_indexes.py.
+
+Columns that are already VARCHAR are skipped, so the script is safe to re-run.
+"""
+
+import asyncio
+import sys
+from sqlalchemy import text
+from app.db.session import engine
+from app.models.models import UserRole, SeatStatus, BookingStatus
+from migrate_indexes import INDEXES
+
+
+# (table, column, enum type, check constraint, python enum)
+ENUM_COLUMNS = [
+    ("users", "role", "userrole", "ck_user_role", UserRole),
+    ("seats", "status", "seatstatus", "ck_seat_status", SeatStatus),
+    ("bookings", "status", "bookingstatus", "ck_booking_status", BookingStatus),
+]
+
+STATUS_PARTIAL_INDEXES = {"ix_seats_event_available", "ix_bookings_confirmed_created_at"}
+
+
+async def get_column_type(conn, table_name: str, column_name: str) -> str:
+    """Return the information_schema data_type of a column"""
+    result = await conn.execute(text("""
+        SELECT data_type
+        FROM information_schema.columns
+        WHERE table_name = :table_name AND column_name = :column_name
+    """), {"table_name": table_name, "column_name": column_name})
+    return result.scalar()
+
+
+async def convert_enum_columns():
+    """Convert native ENUM columns to VARCHAR with CHECK constraints"""
+    async with engine.begin() as conn:
+        print("Starting enum column migration...")
+        
+        pending = [
+            spec for spec in ENUM_COLUMNS
+            if await get_column_type(conn, spec[0], spec[1]) == "USER-DEFINED"
+        ]
+        if not pending:
+            print("✓ All enum columns already converted")
+            return
+        
+        for name in STATUS_PARTIAL_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        
+        for table, column, enum_type, constraint, enum_cls in pending:
+            allowed = ", ".join(f"'{member.name}'" for member in enum_cls)
+            await conn.execute(text(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE VARCHAR(16) USING {column}::text"
+            ))
+            await conn.execute(text(
+                f"ALTER TABLE {table} ADD CONSTRAINT {constraint} CHECK ({column} IN ({allowed}))"
+            ))
+            await conn.execute(text(f"DROP TYPE IF EXISTS {enum_type}"))
+            print(f"✓ {table}.{column}")
+        
+        for name, ddl in INDEXES:
+            if name in STATUS_PARTIAL_INDEXES:
+                await conn.execute(text(ddl))
+                print(f"✓ {name} recreated")
+    
+    print("✅ Enum column migration completed successfully!")
+
+
+async def main():
+    """Main migration function"""
+    try:
+        await convert_enum_columns()
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        print("Please check your database connection and try again.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Migration script to add the generated heat_intensity column to seat_analytics.
+
+heat_intensity is a STORED generated column computed by Postgres from the
+popularity and group booking scores (see HEAT_INTENSITY_SQL in the models), so
+the venue heatmap reads it directly instead of computing it per seat.
+
+The column is added with IF NOT EXISTS, so the script is safe to re-run.
+"""
+
+import asyncio
+import sys
+from sqlalchemy import text
+from app.db.session import engine
+from app.models.models import HEAT_INTENSITY_SQL
+
+
+async def add_heat_intensity_column():
+    """Add the generated heat_intensity column"""
+    async with engine.begin() as conn:
+        print("Starting heat intensity migration...")
+        await conn.execute(text(
+            "ALTER TABLE seat_analytics ADD COLUMN IF NOT EXISTS heat_intensity "
+            f"DOUBLE PRECISION GENERATED ALWAYS AS ({HEAT_INTENSITY_SQL}) STORED"
+        ))
+        print("✓ seat_analytics.heat_intensity")
+    
+    print("✅ Heat intensity migration completed successfully!")
+
+
+async def main():
+    """Main migration function"""
+    try:
+        await add_heat_intensity_column()
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        print("Please check your database connection and try again.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Migration script to add performance indexes to an existing database.
+
+New databases get these indexes from the model definitions via create_all;
+this script adds them to databases created before the indexes existed:
+- ix_bookings_status_event: bookings(status, event_id)
+- ix_seats_event_available: seats(event_id) WHERE status = 'AVAILABLE'
+- ix_bookings_confirmed_created_at: bookings(created_at) WHERE status = 'CONFIRMED'
+- ix_users_email_lower: UNIQUE users(lower(email)); fails if existing emails
+  differ only by case, which must be resolved first
+
+It also drops superseded indexes: the full status indexes on seats
+(ix_seats_status, ix_seats_event_status), since available-seat queries use the
+partial index and per-event scans use uq_event_seat, and the plain unique
+ix_users_email, since ix_users_email_lower already enforces uniqueness.
+
+Every statement uses IF [NOT] EXISTS, so the script is safe to re-run.
+"""
+
+import asyncio
+import sys
+from sqlalchemy import text
+from app.db.session import engine
+
+
+INDEXES = [
+    (
+        "ix_bookings_status_event",
+        "CREATE INDEX IF NOT EXISTS ix_bookings_status_event ON bookings (status, event_id)"
+    ),
+    (
+        "ix_seats_event_available",
+        "CREATE INDEX IF NOT EXISTS ix_seats_event_available ON seats (event_id) "
+        "WHERE status = 'AVAILABLE'"
+    ),
+    (
+        "ix_bookings_confirmed_created_at",
+        "CREATE INDEX IF NOT EXISTS ix_bookings_confirmed_created_at ON bookings (created_at) "
+        "WHERE status = 'CONFIRMED'"
+    ),
+    (
+        "ix_users_email_lower",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email))"
+    ),
+]
+
+DROPPED_INDEXES = [
+    "ix_seats_status",
+    "ix_seats_event_status",
+    "ix_users_email",
+]
+
+
+async def create_indexes():
+    """Create all missing indexes and drop superseded ones"""
+    async with engine.begin() as conn:
+        print("Starting index migration...")
+        for name, ddl in INDEXES:
+            await conn.execute(text(ddl))
+            print(f"✓ {name}")
+        for name in DROPPED_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            print(f"✓ dropped {name}")
+    
+    print("✅ Index migration completed successfully!")
+
+
+async def main():
+    """Main migration function"""
+    try:
+        await create_indexes()
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        print("Please check your database connection and try again.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert price columns from FLOAT to exact NUMERIC.
+
+Databases created before this change store money as double precision:
+- events.base_price -> NUMERIC(10,2)
+- bookings.base_price_per_ticket -> NUMERIC(10,2)
+- bookings.final_price_per_ticket -> NUMERIC(10,2)
+- bookings.total_amount -> NUMERIC(10,2)
+- bookings.price_multiplier -> NUMERIC(6,4)
+
+Existing values are rounded to the column scale. Columns that are already
+NUMERIC are skipped, so the script is safe to re-run.
+"""
+
+import asyncio
+import sys
+from sqlalchemy import text
+from app.db.session import engine
+
+
+# (table, column, precision, scale)
+PRICE_COLUMNS = [
+    ("events", "base_price", 10, 2),
+    ("bookings", "base_price_per_ticket", 10, 2),
+    ("bookings", "final_price_per_ticket", 10, 2),
+    ("bookings", "total_amount", 10, 2),
+    ("bookings", "price_multiplier", 6, 4),
+]
+
+
+async def get_column_type(conn, table_name: str, column_name: str) -> str:
+    """Return the information_schema data_type of a column"""
+    result = await conn.execute(text("""
+        SELECT data_type
+        FROM information_schema.columns
+        WHERE table_name = :table_name AND column_name = :column_name
+    """), {"table_name": table_name, "column_name": column_name})
+    return result.scalar()
+
+
+async def convert_price_columns():
+    """Convert FLOAT price columns to NUMERIC"""
+    async with engine.begin() as conn:
+        print("Starting price column migration...")
+        for table, column, precision, scale in PRICE_COLUMNS:
+            if await get_column_type(conn, table, column) == "numeric":
+                print(f"✓ {table}.{column} already NUMERIC")
+                continue
+            await conn.execute(text(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE NUMERIC({precision},{scale}) "
+                f"USING round({column}::numeric, {scale})"
+            ))
+            print(f"✓ {table}.{column}")
+    
+    print("✅ Price column migration completed successfully!")
+
+
+async def main():
+    """Main migration function"""
+    try:
+        await convert_price_columns()
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        print("Please check your database connection and try again.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
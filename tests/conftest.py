@@ -0,0 +1,88 @@
+"""
+Integration test setup.
+
+The tests run against a real PostgreSQL database given by TEST_DATABASE_URL
+(e.g. postgresql+asyncpg://postgres@localhost:5432/ticketing_test); the schema
+is dropped and recreated for every test. Without it the tests are skipped.
+Redis is optional: if it is unreachable the cache is simply disabled.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Settings are read at import time, so they must be in place before any app import
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql+asyncpg://localhost/unused"
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("CELERY_BROKER_URL", "memory://")
+os.environ.setdefault("CELERY_RESULT_BACKEND", "cache+memory://")
+os.environ.setdefault("SMTP_FROM", "noreply@example.com")
+os.environ.setdefault("ENVIRONMENT", "test")
+
+
+@pytest_asyncio.fixture
+async def db():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from app.db.session import engine, AsyncSessionLocal
+    from app.models.models import Base
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        yield session
+
+    # Pooled asyncpg connections are bound to this test's event loop
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def seeded_event(db):
+    """An admin user and a 5-seat event (A01-01 ... A01-05) at base price 40.0, as ids"""
+    from app.models.models import User, UserRole
+    from app.services.booking import EventService
+
+    admin = User(email="admin@example.com", hashed_password="not-a-real-hash", role=UserRole.ADMIN)
+    db.add(admin)
+    await db.commit()
+    start = datetime.now(timezone.utc) + timedelta(days=30)
+    event = await EventService.create_event_with_seats(
+        db=db,
+        name="Concert",
+        venue="Hall",
+        description=None,
+        start_time=start,
+        end_time=start + timedelta(hours=3),
+        total_capacity=5,
+        created_by=admin.id,
+        base_price=40.0
+    )
+    # A failed booking rolls the session back, which expires loaded instances
+    return admin.id, event.id
+
+
+@pytest_asyncio.fixture
+async def client(db):
+    """HTTP client for the app (lifespan is not run; the db fixture owns the schema)"""
+    from httpx import AsyncClient
+    from app.main import app
+
+    async with AsyncClient(app=app, base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.fixture
+def admin_headers(seeded_event):
+    from app.core.security import create_access_token
+
+    admin_id, _ = seeded_event
+    token = create_access_token({"sub": "admin@example.com", "uid": str(admin_id)})
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,70 @@
+import time as pytime
+from datetime import datetime, time, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text, update
+
+from app.api import admin as admin_api
+from app.main import app
+from app.models.models import Booking
+from app.services.booking import BookingService
+
+
+@pytest.mark.asyncio
+async def test_popular_events_lists_booked_events(db, client, seeded_event, admin_headers):
+    admin_id, event_id = seeded_event
+    await BookingService.create_booking(db, admin_id, event_id, ["A01-01"])
+
+    response = await client.get("/admin/analytics/events/popular", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"event_id": str(event_id), "event_name": "Concert", "booking_count": 1}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_daily_trends_day_bounds_follow_session_time_zone(
+    db, client, seeded_event, admin_headers, monkeypatch
+):
+    if await db.scalar(text("SELECT current_setting('TimeZone')")) not in ("UTC", "Etc/UTC"):
+        pytest.skip("expects the test database to run in UTC")
+    admin_id, event_id = seeded_event
+    booking = await BookingService.create_booking(db, admin_id, event_id, ["A01-01"])
+    # Early in today's UTC day, i.e. inside today's window for the UTC database session
+    today = datetime.now(timezone.utc).date()
+    await db.execute(
+        update(Booking)
+        .where(Booking.id == booking.id)
+        .values(created_at=datetime.combine(today, time(6), tzinfo=timezone.utc))
+    )
+    await db.commit()
+
+    # An app process far from the database's time zone must not shift the day window
+    monkeypatch.setenv("TZ", "Etc/GMT+12")
+    pytime.tzset()
+    try:
+        response = await client.get(
+            "/admin/analytics/trends/daily", params={"days": 1}, headers=admin_headers
+        )
+    finally:
+        monkeypatch.undo()
+        pytime.tzset()
+
+    assert response.status_code == 200
+    assert [(row["date"], row["bookings"]) for row in response.json()] == [(today.isoformat(), 1)]
+
+
+@pytest.mark.asyncio
+async def test_daily_trends_query_error_is_not_a_truncated_200(db, seeded_event, admin_headers, monkeypatch):
+    async def failing_trends(days):
+        raise ConnectionError("database unavailable")
+        yield  # pragma: no cover - makes this an async generator
+
+    monkeypatch.setattr(admin_api, "stream_daily_booking_trends", failing_trends)
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/admin/analytics/trends/daily", headers=admin_headers)
+
+    assert response.status_code == 500
@@ -0,0 +1,77 @@
+import pytest
+from sqlalchemy import select
+
+from app.models.models import Seat, SeatStatus, BookingStatus
+from app.services.booking import BookingService
+
+
+@pytest.mark.asyncio
+async def test_create_booking_claims_seats_and_prices_from_event(db, seeded_event):
+    user_id, event_id = seeded_event
+
+    booking = await BookingService.create_booking(db, user_id, event_id, ["A01-01", "A01-02"])
+
+    assert booking.status == BookingStatus.CONFIRMED
+    assert booking.base_price_per_ticket == 40.0
+    assert booking.total_amount == pytest.approx(booking.final_price_per_ticket * 2, abs=0.01)
+    assert len(booking.tickets) == 2
+
+    statuses = dict((await db.execute(
+        select(Seat.seat_identifier, Seat.status).where(Seat.event_id == event_id)
+    )).all())
+    assert statuses["A01-01"] == SeatStatus.BOOKED
+    assert statuses["A01-02"] == SeatStatus.BOOKED
+    assert statuses["A01-03"] == SeatStatus.AVAILABLE
+
+
+@pytest.mark.asyncio
+async def test_create_booking_rejects_taken_seats(db, seeded_event):
+    user_id, event_id = seeded_event
+    await BookingService.create_booking(db, user_id, event_id, ["A01-01"])
+
+    with pytest.raises(ValueError, match="no longer available"):
+        await BookingService.create_booking(db, user_id, event_id, ["A01-01", "A01-02"])
+
+    # The failed attempt is rolled back, so its other seat is still free
+    booking = await BookingService.create_booking(db, user_id, event_id, ["A01-02"])
+    assert len(booking.tickets) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_booking_rejects_unknown_seats(db, seeded_event):
+    user_id, event_id = seeded_event
+
+    with pytest.raises(ValueError, match="Seats not found"):
+        await BookingService.create_booking(db, user_id, event_id, ["A01-01", "Z99-99"])
+
+
+@pytest.mark.asyncio
+async def test_create_booking_rejects_unknown_event(db, seeded_event):
+    user_id, event_id = seeded_event
+
+    with pytest.raises(ValueError, match="Event not found"):
+        await BookingService.create_booking(db, user_id, user_id, ["A01-01"])
+
+
+@pytest.mark.asyncio
+async def test_create_booking_rejects_changed_price(db, seeded_event):
+    user_id, event_id = seeded_event
+
+    with pytest.raises(ValueError, match="Price has changed"):
+        await BookingService.create_booking(
+            db, user_id, event_id, ["A01-01"], acknowledged_price_per_ticket=0.01
+        )
+
+    # The seat claimed before the price check is released by the rollback
+    booking = await BookingService.create_booking(db, user_id, event_id, ["A01-01"])
+    assert len(booking.tickets) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_booking_books_duplicate_identifiers_once(db, seeded_event):
+    user_id, event_id = seeded_event
+
+    booking = await BookingService.create_booking(db, user_id, event_id, ["A01-01", "A01-02", "A01-01"])
+
+    assert len(booking.tickets) == 2
+    assert booking.total_amount == pytest.approx(booking.final_price_per_ticket * 2, abs=0.01)
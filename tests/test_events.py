@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from app.crud.event import create_seats_for_event
+from app.db.session import run_in_session
+from app.schemas.schemas import SeatMapResponse
+
+
+@pytest.mark.asyncio
+async def test_seat_map_cold_build_matches_schema(client, seeded_event):
+    _, event_id = seeded_event
+
+    response = await client.get(f"/events/{event_id}/seats")
+
+    assert response.status_code == 200
+    seat_map = SeatMapResponse.model_validate_json(response.content)
+    assert seat_map.event_id == event_id
+    assert sorted(seat.seat_identifier for seat in seat_map.seats) == [
+        "A01-01", "A01-02", "A01-03", "A01-04", "A01-05"
+    ]
+    assert {seat.status.value for seat in seat_map.seats} == {"available"}
+
+
+@pytest.mark.asyncio
+async def test_seat_map_unknown_event(client, seeded_event):
+    admin_id, _ = seeded_event
+
+    response = await client.get(f"/events/{admin_id}/seats")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_seats_for_event_skips_existing_seats(db, seeded_event):
+    _, event_id = seeded_event
+
+    seats = await create_seats_for_event(db, event_id, ["A01-05", "A01-06", "A01-07", "A01-06"])
+
+    assert sorted(seat.seat_identifier for seat in seats) == ["A01-06", "A01-07"]
+    assert await create_seats_for_event(db, event_id, ["A01-06", "A01-07"]) == []
+
+
+@pytest.mark.asyncio
+async def test_create_seats_for_event_concurrent_callers(db, seeded_event):
+    _, event_id = seeded_event
+    new_ids = [f"B01-{i:02d}" for i in range(1, 51)]
+
+    results = await asyncio.gather(
+        run_in_session(create_seats_for_event, event_id, new_ids),
+        run_in_session(create_seats_for_event, event_id, new_ids)
+    )
+
+    created = [seat.seat_identifier for seats in results for seat in seats]
+    assert sorted(created) == new_ids
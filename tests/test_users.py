@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import inspect, text
+
+from app.crud import user as user_crud
+from app.models.models import User
+
+
+async def _add_user(db, email):
+    db.add(User(email=email, hashed_password="stored-hash"))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_email_is_case_insensitive(db):
+    await _add_user(db, "Someone@Example.com")
+
+    user = await user_crud.get_user_by_email(db, "someone@EXAMPLE.com")
+
+    assert user is not None
+    assert user.email == "Someone@Example.com"
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_loads_only_login_columns(db, monkeypatch):
+    await _add_user(db, "someone@example.com")
+    monkeypatch.setattr(
+        user_crud, "verify_password_cached",
+        lambda email, password, hashed: hashed == "stored-hash" and password == "secret"
+    )
+    db.expunge_all()
+
+    user = await user_crud.authenticate_user(db, "SOMEONE@example.com", "secret")
+
+    assert user is not None
+    assert "created_at" in inspect(user).unloaded
+    assert await user_crud.authenticate_user(db, "someone@example.com", "wrong") is None
+
+
+@pytest.mark.asyncio
+async def test_email_has_a_single_unique_index(db):
+    rows = await db.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE tablename = 'users' AND indexdef LIKE '%email%'"
+    ))
+
+    assert [name for (name,) in rows] == ["ix_users_email_lower"]